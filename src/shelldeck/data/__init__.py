@@ -1,6 +1,15 @@
 from .db import Database
-from .json_io import export_json, import_json
+from .json_io import build_export_data, export_json, import_json, write_export_data
 from .models import Group, Host
 from .repository import Repository
 
-__all__ = ["Database", "Repository", "Group", "Host", "export_json", "import_json"]
+__all__ = [
+    "Database",
+    "Repository",
+    "Group",
+    "Host",
+    "build_export_data",
+    "export_json",
+    "import_json",
+    "write_export_data",
+]
@@ -4,9 +4,15 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 from .models import Host
-from .repository import Repository
+from .repository import HostMergeIndex, Repository
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
 
 
 @dataclass(frozen=True)
@@ -17,6 +23,10 @@ class ImportResult:
 
 
 def export_json(repository: Repository, path: str | Path, settings: dict | None = None) -> None:
+    write_export_data(build_export_data(repository, settings), path)
+
+
+def build_export_data(repository: Repository, settings: dict | None = None) -> dict[str, Any]:
     groups = repository.list_groups()
     data = {
         "schema_version": 2,
@@ -50,19 +60,64 @@ def export_json(repository: Repository, path: str | Path, settings: dict | None
             )
 
     data["tags"] = sorted(tags_set)
+    return data
+
+
+def write_export_data(data: dict[str, Any], path: str | Path) -> None:
+    with Path(path).open("w", encoding="utf-8") as handle:
+        handle.writelines(json.JSONEncoder(indent=2).iterencode(data))
+
+
+def _require_json_object(path: Path) -> None:
+    with path.open("rb") as handle:
+        try:
+            _, event, _ = next(ijson.parse(handle))
+        except ijson.JSONError as exc:
+            raise ValueError(f"Invalid JSON export: {exc}") from exc
+    if event != "start_map":
+        raise ValueError("JSON export must be an object")
+
 
-    output_path = Path(path)
-    output_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+def _iter_json_items(path: Path, prefix: str) -> Iterator[Any]:
+    with path.open("rb") as handle:
+        try:
+            yield from ijson.items(handle, prefix, use_float=True)
+        except ijson.JSONError as exc:
+            raise ValueError(f"Invalid JSON export: {exc}") from exc
 
 
 def import_json(repository: Repository, path: str | Path) -> ImportResult:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    """Import groups and hosts from an export file.
+
+    All writes happen in one transaction, so a malformed or truncated file leaves
+    the database untouched. Parse errors are raised as ``ValueError``.
+    """
+    input_path = Path(path)
+    if ijson is not None:
+        _require_json_object(input_path)
+        group_payloads: Iterable[Any] = _iter_json_items(input_path, "groups.item")
+        host_payloads: Iterable[Any] = _iter_json_items(input_path, "hosts.item")
+    else:
+        data = json.loads(input_path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError("JSON export must be an object")
+        group_payloads = data.get("groups", [])
+        host_payloads = data.get("hosts", [])
+    with repository.transaction():
+        return _import_payloads(repository, group_payloads, host_payloads)
+
+
+def _import_payloads(
+    repository: Repository, group_payloads: Iterable[Any], host_payloads: Iterable[Any]
+) -> ImportResult:
     groups_added = 0
     hosts_inserted = 0
     hosts_updated = 0
 
-    groups_by_name: dict[str, int] = {group.name: group.id for group in repository.list_groups()}
-    for group_payload in data.get("groups", []):
+    groups_with_hosts = repository.list_groups_with_hosts()
+    groups_by_name: dict[str, int] = {group.name: group.id for group, _ in groups_with_hosts}
+    merge_index = HostMergeIndex(host for _, hosts in groups_with_hosts for host in hosts)
+    for group_payload in group_payloads:
         name = str(group_payload.get("name", "")).strip()
         if not name or name in groups_by_name:
             continue
@@ -70,7 +125,7 @@ def import_json(repository: Repository, path: str | Path) -> ImportResult:
         groups_by_name[group.name] = group.id
         groups_added += 1
 
-    for host_payload in data.get("hosts", []):
+    for host_payload in host_payloads:
         group_name = str(host_payload.get("group", "")).strip() or "Imported"
         group_id = groups_by_name.get(group_name)
         if group_id is None:
@@ -91,7 +146,7 @@ def import_json(repository: Repository, path: str | Path) -> ImportResult:
         color = host_payload.get("color")
         tag = host_payload.get("tag")
 
-        existing = repository.find_host_for_merge(group_id, hostname or None, name or None)
+        existing = merge_index.find(group_id, hostname or None, name or None)
         if existing:
             updated = Host(
                 id=existing.id,
@@ -115,6 +170,7 @@ def import_json(repository: Repository, path: str | Path) -> ImportResult:
                 tag=str(tag) if tag is not None else existing.tag,
             )
             repository.update_host(updated)
+            merge_index.replace(existing, updated)
             hosts_updated += 1
         else:
             created = Host(
@@ -134,7 +190,7 @@ def import_json(repository: Repository, path: str | Path) -> ImportResult:
                 color=str(color) if color is not None else None,
                 tag=str(tag) if tag is not None else None,
             )
-            repository.create_host(created)
+            merge_index.add(repository.create_host(created))
             hosts_inserted += 1
 
     return ImportResult(
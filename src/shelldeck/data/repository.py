@@ -1,16 +1,88 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
 import sqlite3
 from pathlib import Path
+from typing import Callable, ContextManager, Iterable, Iterator
 
 from .db import Database, get_default_db_path
 from .models import Group, Host
 
 
+_INSERT_HOST_SQL = """
+    INSERT INTO hosts
+        (group_id, name, hostname, port, user, identity_file, ssh_config_host_alias, notes,
+         favorite, color, tag)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_HOST_SQL = """
+    UPDATE hosts
+    SET group_id = ?, name = ?, hostname = ?, port = ?, user = ?,
+        identity_file = ?, ssh_config_host_alias = ?, notes = ?,
+        favorite = ?, color = ?, tag = ?
+    WHERE id = ?
+"""
+
+
+def _host_values(host: Host) -> tuple[object, ...]:
+    return (
+        host.group_id,
+        host.name,
+        host.hostname,
+        host.port,
+        host.user,
+        host.identity_file,
+        host.ssh_config_host_alias,
+        host.notes,
+        1 if host.favorite else 0,
+        host.color,
+        host.tag,
+    )
+
+
+class HostMergeIndex:
+    """In-memory stand-in for ``Repository.find_host_for_merge`` over preloaded hosts."""
+
+    def __init__(self, hosts: Iterable[Host] = ()) -> None:
+        self._by_hostname: dict[tuple[int, str], list[Host]] = {}
+        self._by_name: dict[tuple[int, str], list[Host]] = {}
+        for host in hosts:
+            self.add(host)
+
+    def find(self, group_id: int, hostname: str | None, name: str | None) -> Host | None:
+        if hostname:
+            matches = self._by_hostname.get((group_id, hostname))
+            if matches:
+                return min(matches, key=lambda host: host.id)
+        if name:
+            matches = self._by_name.get((group_id, name))
+            if matches:
+                return min(matches, key=lambda host: host.id)
+        return None
+
+    def add(self, host: Host) -> None:
+        self._by_hostname.setdefault((host.group_id, host.hostname), []).append(host)
+        self._by_name.setdefault((host.group_id, host.name), []).append(host)
+
+    def replace(self, old: Host, new: Host) -> None:
+        for index, key in (
+            (self._by_hostname, (old.group_id, old.hostname)),
+            (self._by_name, (old.group_id, old.name)),
+        ):
+            matches = index.get(key, [])
+            if old in matches:
+                matches.remove(old)
+            if not matches:
+                index.pop(key, None)
+        self.add(new)
+
+
 @dataclass
 class Repository:
     _db: Database
+    _in_transaction: bool = field(default=False, init=False)
 
     @classmethod
     def open_default(cls) -> "Repository":
@@ -27,6 +99,22 @@ class Repository:
     def connection(self) -> sqlite3.Connection:
         return self._db.connection
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one commit; rolls everything back on error."""
+        if self._in_transaction:
+            yield
+            return
+        self._in_transaction = True
+        try:
+            with self.connection:
+                yield
+        finally:
+            self._in_transaction = False
+
+    def _write(self) -> ContextManager[object]:
+        return nullcontext() if self._in_transaction else self.connection
+
     def list_groups(self) -> list[Group]:
         cursor = self.connection.execute("SELECT id, name FROM groups ORDER BY name")
         return [Group.from_row(row) for row in cursor.fetchall()]
@@ -47,21 +135,21 @@ class Repository:
         existing = self.get_group_by_name(name)
         if existing:
             return existing
-        with self.connection:
+        with self._write():
             cursor = self.connection.execute("INSERT INTO groups (name) VALUES (?)", (name,))
         return Group(id=int(cursor.lastrowid), name=name)
 
     def create_group(self, name: str) -> Group:
-        with self.connection:
+        with self._write():
             cursor = self.connection.execute("INSERT INTO groups (name) VALUES (?)", (name,))
         return Group(id=int(cursor.lastrowid), name=name)
 
     def update_group(self, group_id: int, name: str) -> None:
-        with self.connection:
+        with self._write():
             self.connection.execute("UPDATE groups SET name = ? WHERE id = ?", (name, group_id))
 
     def delete_group(self, group_id: int) -> None:
-        with self.connection:
+        with self._write():
             self.connection.execute("DELETE FROM groups WHERE id = ?", (group_id,))
 
     def list_hosts_for_group(self, group_id: int) -> list[Host]:
@@ -119,28 +207,8 @@ class Repository:
         return None
 
     def create_host(self, host: Host) -> Host:
-        with self.connection:
-            cursor = self.connection.execute(
-                """
-                INSERT INTO hosts
-                    (group_id, name, hostname, port, user, identity_file, ssh_config_host_alias, notes,
-                     favorite, color, tag)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    host.group_id,
-                    host.name,
-                    host.hostname,
-                    host.port,
-                    host.user,
-                    host.identity_file,
-                    host.ssh_config_host_alias,
-                    host.notes,
-                    1 if host.favorite else 0,
-                    host.color,
-                    host.tag,
-                ),
-            )
+        with self._write():
+            cursor = self.connection.execute(_INSERT_HOST_SQL, _host_values(host))
         created = Host(
             id=int(cursor.lastrowid),
             group_id=host.group_id,
@@ -160,34 +228,46 @@ class Repository:
         return created
 
     def update_host(self, host: Host) -> None:
-        with self.connection:
-            self.connection.execute(
-                """
-                UPDATE hosts
-                SET group_id = ?, name = ?, hostname = ?, port = ?, user = ?,
-                    identity_file = ?, ssh_config_host_alias = ?, notes = ?,
-                    favorite = ?, color = ?, tag = ?
-                WHERE id = ?
-                """,
-                (
-                    host.group_id,
-                    host.name,
-                    host.hostname,
-                    host.port,
-                    host.user,
-                    host.identity_file,
-                    host.ssh_config_host_alias,
-                    host.notes,
-                    1 if host.favorite else 0,
-                    host.color,
-                    host.tag,
-                    host.id,
-                ),
-            )
+        with self._write():
+            self.connection.execute(_UPDATE_HOST_SQL, (*_host_values(host), host.id))
         self._set_host_tags(host.id, host.tags)
 
+    def import_hosts(
+        self,
+        group_id: int,
+        hosts: Iterable[Host],
+        merge: Callable[[Host, Host], Host],
+    ) -> tuple[int, int]:
+        """Insert or merge ``hosts`` into a group in one transaction.
+
+        Matching follows ``find_host_for_merge`` (hostname first, then name) against
+        an in-memory index of the group, so hosts added earlier in the same batch are
+        merged too. Returns ``(inserted, updated)``.
+        """
+        index = HostMergeIndex(self.list_hosts_for_group(group_id))
+        inserted = 0
+        updated = 0
+        with self.transaction():
+            for host in hosts:
+                current = index.find(group_id, host.hostname, host.name)
+                if current is not None:
+                    stored = merge(current, host)
+                    self.connection.execute(_UPDATE_HOST_SQL, (*_host_values(stored), stored.id))
+                    if stored.tags != current.tags:
+                        self._set_host_tags(stored.id, stored.tags)
+                    index.replace(current, stored)
+                    updated += 1
+                else:
+                    cursor = self.connection.execute(_INSERT_HOST_SQL, _host_values(host))
+                    stored = replace(host, id=int(cursor.lastrowid))
+                    if stored.tags:
+                        self._set_host_tags(stored.id, stored.tags)
+                    index.add(stored)
+                    inserted += 1
+        return inserted, updated
+
     def delete_host(self, host_id: int) -> None:
-        with self.connection:
+        with self._write():
             self.connection.execute("DELETE FROM hosts WHERE id = ?", (host_id,))
 
     def _get_tags_for_hosts(self, host_ids: list[int]) -> dict[int, list[str]]:
@@ -223,7 +303,7 @@ class Repository:
         existing = {str(row["name"]): int(row["id"]) for row in cursor.fetchall()}
         missing = [name for name in normalized if name not in existing]
         if missing:
-            with self.connection:
+            with self._write():
                 for name in missing:
                     cursor = self.connection.execute(
                         "INSERT INTO tags (name) VALUES (?)",
@@ -234,7 +314,7 @@ class Repository:
 
     def _set_host_tags(self, host_id: int, tags: list[str]) -> None:
         cleaned = [tag.strip() for tag in tags if tag.strip()]
-        with self.connection:
+        with self._write():
             self.connection.execute("DELETE FROM host_tags WHERE host_id = ?", (host_id,))
             if not cleaned:
                 return
@@ -5,6 +5,8 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from .icons import safe_icon
 from .ssh_agent_status import AgentState, KeyInfo, SshAgentStatus, StatusSnapshot
 
+_ELLIPSIS = "..."
+
 
 class TopBar(QtWidgets.QToolBar):
     sidebar_toggle_requested = QtCore.Signal()
@@ -34,6 +36,10 @@ class TopBar(QtWidgets.QToolBar):
         self._content_actions: list[QtGui.QAction] = []
         self._content_widgets: list[QtWidgets.QWidget] = []
         self._toggle_button: QtWidgets.QToolButton | None = None
+        self._resize_coalesce_timer = QtCore.QTimer(self)
+        self._resize_coalesce_timer.setSingleShot(True)
+        self._resize_coalesce_timer.setInterval(50)
+        self._resize_coalesce_timer.timeout.connect(self._store_expanded_height)
 
         self._use_ssh_agent: bool = True
         self._ssh_agent_status = SshAgentStatus(self)
@@ -43,12 +49,17 @@ class TopBar(QtWidgets.QToolBar):
         self._ssh_status_timer.setInterval(20000)
         self._ssh_status_timer.timeout.connect(self._refresh_ssh_agent)
         self._ssh_status_timer.start()
+        app = QtGui.QGuiApplication.instance()
+        if isinstance(app, QtGui.QGuiApplication):
+            app.applicationStateChanged.connect(self._on_application_state_changed)
 
         self._ssh_status_widget: QtWidgets.QWidget | None = None
         self._ssh_status_label: QtWidgets.QLabel | None = None
         self._ssh_status_dot: QtWidgets.QLabel | None = None
         self._ssh_agent_button: QtWidgets.QToolButton | None = None
         self._ssh_agent_tooltip = ""
+        self._ssh_agent_tooltip_head = ""
+        self._last_snapshot_key: tuple[object, ...] | None = None
 
         self._build_actions()
         self._build_right_status()
@@ -150,11 +161,11 @@ class TopBar(QtWidgets.QToolBar):
         return max(self._rail_height, height)
 
     def _apply_height(self, height: int, *, lock: bool) -> None:
+        maximum = height if lock else 16777215
+        if self.minimumHeight() == height and self.maximumHeight() == maximum:
+            return
         self.setMinimumHeight(height)
-        if lock:
-            self.setMaximumHeight(height)
-        else:
-            self.setMaximumHeight(16777215)
+        self.setMaximumHeight(maximum)
         self.updateGeometry()
 
     def is_collapsed(self) -> bool:
@@ -193,9 +204,34 @@ class TopBar(QtWidgets.QToolBar):
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
+        if not self._collapsed:
+            self._resize_coalesce_timer.start()
+
+    def _store_expanded_height(self) -> None:
         if not self._collapsed:
             self._expanded_height = max(self._rail_height, self.height())
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self._resume_ssh_status_polling()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        super().hideEvent(event)
+        self._ssh_status_timer.stop()
+
+    def _on_application_state_changed(self, state: QtCore.Qt.ApplicationState) -> None:
+        if state == QtCore.Qt.ApplicationState.ApplicationActive:
+            if self.isVisible():
+                self._resume_ssh_status_polling()
+        else:
+            self._ssh_status_timer.stop()
+
+    def _resume_ssh_status_polling(self) -> None:
+        if self._ssh_status_timer.isActive():
+            return
+        self._ssh_status_timer.start()
+        self._refresh_ssh_agent()
+
     def _refresh_ssh_agent(self) -> None:
         self._ssh_agent_status.refresh()
 
@@ -217,6 +253,14 @@ class TopBar(QtWidgets.QToolBar):
     def _apply_ssh_agent_status(self, snapshot: StatusSnapshot) -> None:
         if self._ssh_status_dot is None or self._ssh_status_widget is None:
             return
+        snapshot_key = self._snapshot_key(snapshot)
+        if snapshot_key == self._last_snapshot_key:
+            self._set_ssh_agent_tooltip(
+                self._ssh_agent_tooltip_head + self._format_tooltip_tail(snapshot)
+            )
+            return
+        self._last_snapshot_key = snapshot_key
+
         color_map = {
             AgentState.OFF: "#64748b",
             AgentState.OK_KEYS: "#22c55e",
@@ -225,9 +269,24 @@ class TopBar(QtWidgets.QToolBar):
         }
         dot_color = color_map.get(snapshot.state, "#64748b")
         self._ssh_status_dot.setStyleSheet(f"background: {dot_color}; border-radius: 4px;")
-        tooltip = self._build_ssh_agent_tooltip(snapshot)
+        self._set_ssh_agent_tooltip(self._build_ssh_agent_tooltip(snapshot))
+
+    def _snapshot_key(self, snapshot: StatusSnapshot) -> tuple[object, ...]:
+        return (
+            snapshot.state,
+            snapshot.use_agent_enabled,
+            snapshot.agent_reachable,
+            snapshot.keys_loaded,
+            snapshot.ssh_auth_sock,
+            snapshot.detected_while_off,
+            snapshot.keys,
+            snapshot.last_error,
+        )
+
+    def _set_ssh_agent_tooltip(self, tooltip: str) -> None:
         self._ssh_agent_tooltip = tooltip
-        self._ssh_status_widget.setToolTip(tooltip)
+        if self._ssh_status_widget is not None:
+            self._ssh_status_widget.setToolTip(tooltip)
         if self._ssh_status_label is not None:
             self._ssh_status_label.setToolTip(tooltip)
         if self._ssh_status_dot is not None:
@@ -238,7 +297,8 @@ class TopBar(QtWidgets.QToolBar):
         reachable = "Yes" if snapshot.agent_reachable else "No"
         keys_loaded = str(snapshot.keys_loaded) if snapshot.keys_loaded is not None else "n/a"
         sock_value = snapshot.ssh_auth_sock or "not set"
-        sock_value = self._truncate_text(sock_value, 64)
+        if len(sock_value) > 64:
+            sock_value = self._truncate_text(sock_value, 64)
         lines = [
             "SSH Agent",
             "--------",
@@ -255,10 +315,14 @@ class TopBar(QtWidgets.QToolBar):
             lines.append("Fingerprints:")
             lines.extend(self._format_key_lines(snapshot.keys))
 
+        # Everything above only changes with the snapshot key; keep it so unchanged
+        # polls just refresh the trailing "Last check" line.
+        self._ssh_agent_tooltip_head = "\n".join(lines) + "\n"
+        return self._ssh_agent_tooltip_head + self._format_tooltip_tail(snapshot)
+
+    def _format_tooltip_tail(self, snapshot: StatusSnapshot) -> str:
         last_check = snapshot.last_checked.strftime("%Y-%m-%d %H:%M:%S")
-        lines.append(f"Last check: {last_check}")
-        lines.append(f"Error: {snapshot.last_error or '(none)'}")
-        return "\n".join(lines)
+        return f"Last check: {last_check}\nError: {snapshot.last_error or '(none)'}"
 
     def _format_key_lines(self, keys: tuple[KeyInfo, ...]) -> list[str]:
         max_keys = 3
@@ -278,4 +342,4 @@ class TopBar(QtWidgets.QToolBar):
     def _truncate_text(self, value: str, max_length: int) -> str:
         if len(value) <= max_length:
             return value
-        return f"{value[: max_length - 3]}..."
+        return value[: max_length - len(_ELLIPSIS)] + _ELLIPSIS
@@ -75,14 +75,16 @@ class UiStateManager:
         sidebar = getattr(window, "sidebar", None)
         sidebar_collapsed: bool | None = None
         if sidebar is not None:
-            sidebar_collapsed = bool(getattr(sidebar, "is_collapsed", lambda: False)())
+            is_collapsed = getattr(sidebar, "is_collapsed", None)
+            sidebar_collapsed = bool(is_collapsed()) if callable(is_collapsed) else False
             self._settings.setValue("ui/sidebar/collapsed", sidebar_collapsed)
             self._settings.setValue("ui/sidebar/rail_width", sidebar.rail_width())
             last_width = getattr(window, "_sidebar_last_width", None)
             if isinstance(last_width, int):
                 self._settings.setValue("ui/sidebar/last_width", last_width)
 
-            selected = getattr(sidebar, "selected_item_key", lambda: None)()
+            selected_item_key = getattr(sidebar, "selected_item_key", None)
+            selected = selected_item_key() if callable(selected_item_key) else None
             if selected is None:
                 self._settings.remove("ui/sidebar/selection")
             else:
@@ -159,18 +161,17 @@ class UiStateManager:
         if sidebar is None:
             return None
 
-        collapsed = self._settings.value("ui/sidebar/collapsed", None, type=bool)
-        if collapsed is None:
+        if self._settings.contains("ui/sidebar/collapsed"):
+            collapsed = bool(self._settings.value("ui/sidebar/collapsed", type=bool))
+        else:
             collapsed = bool(getattr(window, "_sidebar_collapsed", False))
-        collapsed = bool(collapsed)
 
-        width_raw = self._settings.value("ui/sidebar/last_width", None)
         width = getattr(window, "_sidebar_last_width", None)
-        if width_raw is not None:
+        if self._settings.contains("ui/sidebar/last_width"):
             try:
-                width = int(width_raw)
+                width = int(self._settings.value("ui/sidebar/last_width"))
             except (TypeError, ValueError):
-                width = getattr(window, "_sidebar_last_width", None)
+                pass
 
         clamp = getattr(window, "_clamp_sidebar_width", None)
         if width is not None and callable(clamp):
@@ -201,16 +202,16 @@ class UiStateManager:
         topbar = getattr(window, "topbar", None)
         if topbar is None:
             return None
-        collapsed_value = self._settings.value("ui/topbar/collapsed", None, type=bool)
-        if collapsed_value is None:
-            collapsed_value = bool(getattr(topbar, "is_collapsed", lambda: False)())
-        collapsed = bool(collapsed_value)
+        if self._settings.contains("ui/topbar/collapsed"):
+            collapsed = bool(self._settings.value("ui/topbar/collapsed", type=bool))
+        else:
+            is_collapsed = getattr(topbar, "is_collapsed", None)
+            collapsed = bool(is_collapsed()) if callable(is_collapsed) else False
 
-        expanded_raw = self._settings.value("ui/topbar/expanded_height", None)
         expanded_height: int | None = None
-        if expanded_raw is not None:
+        if self._settings.contains("ui/topbar/expanded_height"):
             try:
-                expanded_height = int(expanded_raw)
+                expanded_height = int(self._settings.value("ui/topbar/expanded_height"))
             except (TypeError, ValueError):
                 expanded_height = None
 
@@ -228,8 +229,13 @@ class UiStateManager:
         restore_selection = getattr(sidebar, "restore_selection", None)
         if sidebar is None or not callable(restore_selection):
             return
-        item_type = self._settings.value("ui/sidebar/selection/type", None)
-        item_id = self._settings.value("ui/sidebar/selection/id", None)
+        if not (
+            self._settings.contains("ui/sidebar/selection/type")
+            and self._settings.contains("ui/sidebar/selection/id")
+        ):
+            return
+        item_type = self._settings.value("ui/sidebar/selection/type")
+        item_id = self._settings.value("ui/sidebar/selection/id")
         if item_type is None or item_id is None:
             return
         try:
@@ -245,23 +251,17 @@ class UiStateManager:
     def _named_header_views(
         self, window: QtWidgets.QMainWindow
     ) -> Iterable[QtWidgets.QTreeView | QtWidgets.QTableView]:
-        for view in window.findChildren(QtWidgets.QTreeView):
-            if view.objectName():
-                yield view
-        for view in window.findChildren(QtWidgets.QTableView):
-            if view.objectName():
+        for view in window.findChildren(QtWidgets.QAbstractItemView):
+            if isinstance(view, (QtWidgets.QTreeView, QtWidgets.QTableView)) and view.objectName():
                 yield view
 
     def _load_int_list(self, value: object) -> list[int] | None:
-        if isinstance(value, (list, tuple)):
-            items: list[int] = []
-            for entry in value:
-                try:
-                    items.append(int(entry))
-                except (TypeError, ValueError):
-                    return None
-            return items
-        return None
+        if not isinstance(value, (list, tuple)):
+            return None
+        try:
+            return list(map(int, value))
+        except (TypeError, ValueError):
+            return None
 
     def _current_window_mode(self, window: QtWidgets.QMainWindow) -> str:
         if window.isFullScreen():
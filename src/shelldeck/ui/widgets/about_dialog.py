@@ -1,20 +1,33 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import ast
+import functools
 import os
-from importlib import metadata
-from pathlib import Path
 import platform
 import re
 import sys
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Callable
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover - Python 3.10 without tomllib
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 from ... import __version__
 from ...data.db import get_default_db_path
 from ..sidebar import KOFI_FALLBACK_URL, KOFI_LOCAL_IMAGE, KOFI_PRIMARY_URL
 
+_MUTED_QSS = "color: #94a3b8;"
+_REQ_NAME_RE = re.compile(r"[A-Za-z0-9_.-]+")
+_ROOT_INDEX = QtCore.QModelIndex()
+
 
 @dataclass(frozen=True)
 class DependencyInfo:
@@ -23,6 +36,196 @@ class DependencyInfo:
     source: str
 
 
+def _normalize_dist_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _dist_version_map() -> dict[str, str]:
+    versions: dict[str, str] = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        versions.setdefault(_normalize_dist_name(name), dist.version)
+    return versions
+
+
+@functools.lru_cache(maxsize=4)
+def _kofi_icon(width: int) -> tuple[QtGui.QIcon, QtCore.QSize] | None:
+    badge_pixmap = QtGui.QPixmap(str(KOFI_LOCAL_IMAGE))
+    if badge_pixmap.isNull():
+        return None
+    scaled = badge_pixmap.scaledToWidth(
+        width,
+        QtCore.Qt.TransformationMode.SmoothTransformation,
+    )
+    return QtGui.QIcon(scaled), scaled.size()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_build_info() -> str | None:
+    build = os.environ.get("SHELLDECK_BUILD", "").strip()
+    commit = os.environ.get("SHELLDECK_COMMIT", "").strip()
+    branch = os.environ.get("SHELLDECK_BRANCH", "").strip()
+    parts = [item for item in [build, commit, branch] if item]
+    if not parts:
+        return None
+    return " / ".join(parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dependencies() -> tuple[DependencyInfo, ...]:
+    root = _find_repo_root(Path(__file__).resolve())
+    if root is None:
+        return ()
+
+    dependencies: list[DependencyInfo] = []
+    for specs, source in _load_dependency_specs(root):
+        dependencies.extend(_resolve_dependencies(specs, source))
+
+    deduped = _dedupe_dependencies(dependencies)
+    deduped.sort(key=lambda item: item.name.lower())
+    return tuple(deduped)
+
+
+def _load_dependency_specs(root: Path) -> list[tuple[list[str], str]]:
+    deps = _parse_pyproject_dependencies(root / "pyproject.toml")
+    if deps:
+        return [(deps, "pyproject.toml")]
+    return [
+        (_parse_requirements(path), path.name) for path in sorted(root.glob("requirements*.txt"))
+    ]
+
+
+def _parse_pyproject_dependencies(path: Path) -> list[str]:
+    if tomllib is None:
+        return []
+    try:
+        with path.open("rb") as handle:
+            data = tomllib.load(handle)
+    except (OSError, tomllib.TOMLDecodeError):
+        return []
+    project = data.get("project", {})
+    dependencies = project.get("dependencies", []) if isinstance(project, dict) else []
+    if not isinstance(dependencies, list):
+        return []
+    return [item for item in dependencies if isinstance(item, str)]
+
+
+def _parse_requirements(path: Path) -> list[str]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return [
+                stripped
+                for stripped in (line.strip() for line in handle)
+                if stripped and not stripped.startswith("#")
+            ]
+    except OSError:
+        return []
+
+
+def _resolve_dependencies(specs: list[str], source: str) -> list[DependencyInfo]:
+    resolved: list[DependencyInfo] = []
+    for spec in specs:
+        name = _parse_requirement_name(spec)
+        if not name:
+            continue
+        resolved.append(
+            DependencyInfo(
+                name=name,
+                version=_package_version(name),
+                source=source,
+            )
+        )
+    return resolved
+
+
+def _dedupe_dependencies(deps: list[DependencyInfo]) -> list[DependencyInfo]:
+    seen: dict[str, DependencyInfo] = {}
+    for dep in deps:
+        key = dep.name.lower()
+        if key not in seen:
+            seen[key] = dep
+    return list(seen.values())
+
+
+def _parse_requirement_name(spec: str) -> str:
+    match = _REQ_NAME_RE.match(spec.strip())
+    return match.group(0) if match else ""
+
+
+def _package_version(package: str) -> str:
+    return _dist_version_map().get(_normalize_dist_name(package), "unknown")
+
+
+@functools.lru_cache(maxsize=1)
+def _find_repo_root(start: Path) -> Path | None:
+    for parent in [start] + list(start.parents):
+        if (parent / "pyproject.toml").exists():
+            return parent
+    return None
+
+
+class _DependencyTableModel(QtCore.QAbstractTableModel):
+    _HEADERS = ("Name", "Version", "Source")
+
+    def __init__(
+        self,
+        dependencies: tuple[DependencyInfo, ...],
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._rows = list(dependencies)
+
+    def rowCount(
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        dep = self._rows[index.row()]
+        return (dep.name, dep.version, dep.source)[index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self._HEADERS)
+        ):
+            return self._HEADERS[section]
+        return None
+
+    def sort(
+        self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder
+    ) -> None:
+        if not 0 <= column < len(self._HEADERS):
+            return
+        attribute = ("name", "version", "source")[column]
+        self.beginResetModel()
+        self._rows.sort(
+            key=lambda dep: getattr(dep, attribute).lower(),
+            reverse=order == QtCore.Qt.SortOrder.DescendingOrder,
+        )
+        self.endResetModel()
+
+
 class AboutDialog(QtWidgets.QDialog):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
@@ -32,8 +235,9 @@ class AboutDialog(QtWidgets.QDialog):
         self.resize(820, 600)
 
         self._app_version = self._resolve_app_version()
-        self._build_info = self._resolve_build_info()
-        self._dependencies = self._load_dependencies()
+        self._build_info = _resolve_build_info()
+        self._settings_path = QtCore.QSettings().fileName()
+        self._db_path = str(get_default_db_path())
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -44,13 +248,32 @@ class AboutDialog(QtWidgets.QDialog):
         tabs = QtWidgets.QTabWidget(self)
         tabs.setDocumentMode(True)
         tabs.setTabPosition(QtWidgets.QTabWidget.TabPosition.North)
-        tabs.addTab(self._build_about_tab(), "About")
-        tabs.addTab(self._build_libraries_tab(), "Libraries")
-        tabs.addTab(self._build_system_tab(), "System")
+        self._tab_builders: dict[
+            int, tuple[QtWidgets.QVBoxLayout, Callable[[], QtWidgets.QWidget]]
+        ] = {}
+        for label, builder in (
+            ("About", self._build_about_tab),
+            ("Libraries", self._build_libraries_tab),
+            ("System", self._build_system_tab),
+        ):
+            placeholder = QtWidgets.QWidget()
+            placeholder_layout = QtWidgets.QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[tabs.addTab(placeholder, label)] = (placeholder_layout, builder)
+        self._tabs = tabs
+        tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(tabs.currentIndex())
         layout.addWidget(tabs, 1)
 
         layout.addLayout(self._build_buttons())
 
+    def _ensure_tab(self, index: int) -> None:
+        pending = self._tab_builders.pop(index, None)
+        if pending is None:
+            return
+        placeholder_layout, builder = pending
+        placeholder_layout.addWidget(builder())
+
     def _build_header(self) -> QtWidgets.QLayout:
         header = QtWidgets.QHBoxLayout()
         header.setSpacing(12)
@@ -67,7 +290,7 @@ class AboutDialog(QtWidgets.QDialog):
         name_label.setStyleSheet("font-size: 20px; font-weight: 600;")
         version_label = QtWidgets.QLabel(f"Version {self._app_version}")
         tagline = QtWidgets.QLabel("Linux-first desktop app for organizing SSH workspaces.")
-        tagline.setStyleSheet("color: #94a3b8;")
+        tagline.setStyleSheet(_MUTED_QSS)
 
         text_layout.addWidget(name_label)
         text_layout.addWidget(version_label)
@@ -89,6 +312,7 @@ class AboutDialog(QtWidgets.QDialog):
 
     def _build_about_tab(self) -> QtWidgets.QWidget:
         page = QtWidgets.QWidget(self)
+        page.setUpdatesEnabled(False)
         layout = QtWidgets.QVBoxLayout(page)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(12)
@@ -115,10 +339,12 @@ class AboutDialog(QtWidgets.QDialog):
         layout.addWidget(version_group)
         layout.addWidget(links_group)
         layout.addStretch(1)
+        page.setUpdatesEnabled(True)
         return page
 
     def _build_libraries_tab(self) -> QtWidgets.QWidget:
         page = QtWidgets.QWidget(self)
+        page.setUpdatesEnabled(False)
         layout = QtWidgets.QVBoxLayout(page)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(12)
@@ -132,35 +358,31 @@ class AboutDialog(QtWidgets.QDialog):
 
         runtime_layout.addRow("Python", QtWidgets.QLabel(platform.python_version()))
         runtime_layout.addRow("Qt", QtWidgets.QLabel(QtCore.qVersion()))
-        runtime_layout.addRow("PySide6", QtWidgets.QLabel(self._package_version("PySide6")))
-        runtime_layout.addRow("termqt", QtWidgets.QLabel(self._package_version("termqt")))
+        runtime_layout.addRow("PySide6", QtWidgets.QLabel(_package_version("PySide6")))
+        runtime_layout.addRow("termqt", QtWidgets.QLabel(_package_version("termqt")))
 
         deps_group = QtWidgets.QGroupBox("Dependencies")
         deps_layout = QtWidgets.QVBoxLayout(deps_group)
         deps_layout.setSpacing(6)
-        table = QtWidgets.QTableWidget()
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Name", "Version", "Source"])
-        table.setRowCount(len(self._dependencies))
+        table = QtWidgets.QTableView()
+        table.setModel(_DependencyTableModel(_load_dependencies(), table))
         table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         table.horizontalHeader().setStretchLastSection(True)
         table.verticalHeader().setVisible(False)
-
-        for row, dep in enumerate(self._dependencies):
-            table.setItem(row, 0, QtWidgets.QTableWidgetItem(dep.name))
-            table.setItem(row, 1, QtWidgets.QTableWidgetItem(dep.version))
-            table.setItem(row, 2, QtWidgets.QTableWidgetItem(dep.source))
-
-        table.sortItems(0, QtCore.Qt.SortOrder.AscendingOrder)
+        table.verticalHeader().setDefaultSectionSize(table.fontMetrics().height() + 4)
+        table.setSortingEnabled(True)
+        table.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
         deps_layout.addWidget(table)
 
         layout.addWidget(runtime_group)
         layout.addWidget(deps_group, 1)
+        page.setUpdatesEnabled(True)
         return page
 
     def _build_system_tab(self) -> QtWidgets.QWidget:
         page = QtWidgets.QWidget(self)
+        page.setUpdatesEnabled(False)
         layout = QtWidgets.QVBoxLayout(page)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(12)
@@ -177,8 +399,8 @@ class AboutDialog(QtWidgets.QDialog):
             QtWidgets.QLabel(f"{platform.system()} {platform.release()} ({platform.version()})"),
         )
         system_layout.addRow("Python executable", QtWidgets.QLabel(sys.executable))
-        system_layout.addRow("Settings path", QtWidgets.QLabel(QtCore.QSettings().fileName()))
-        system_layout.addRow("Data path", QtWidgets.QLabel(str(get_default_db_path())))
+        system_layout.addRow("Settings path", QtWidgets.QLabel(self._settings_path))
+        system_layout.addRow("Data path", QtWidgets.QLabel(self._db_path))
         log_path = self._log_path()
         system_layout.addRow("Log path", QtWidgets.QLabel(str(log_path)))
 
@@ -191,6 +413,7 @@ class AboutDialog(QtWidgets.QDialog):
             layout.addWidget(open_logs, alignment=QtCore.Qt.AlignmentFlag.AlignLeft)
 
         layout.addStretch(1)
+        page.setUpdatesEnabled(True)
         return page
 
     def _build_buttons(self) -> QtWidgets.QLayout:
@@ -212,24 +435,23 @@ class AboutDialog(QtWidgets.QDialog):
         QtGui.QGuiApplication.clipboard().setText(text)
 
     def _build_debug_info(self) -> str:
-        lines = [
-            f"ShellDeck {self._app_version}",
+        lines = [f"ShellDeck {self._app_version}"]
+        if self._build_info:
+            lines.append(f"Build {self._build_info}")
+        lines += [
             (
                 f"Python {platform.python_version()} | Qt {QtCore.qVersion()} | "
-                f"PySide6 {self._package_version('PySide6')}"
+                f"PySide6 {_package_version('PySide6')}"
             ),
             f"OS {platform.system()} {platform.release()} ({platform.version()})",
             f"Executable {sys.executable}",
-            f"Settings {QtCore.QSettings().fileName()}",
-            f"Data {get_default_db_path()}",
+            f"Settings {self._settings_path}",
+            f"Data {self._db_path}",
             f"Logs {self._log_path()}",
+            "",
+            "Dependencies:",
         ]
-        if self._build_info:
-            lines.insert(1, f"Build {self._build_info}")
-        lines.append("")
-        lines.append("Dependencies:")
-        for dep in sorted(self._dependencies, key=lambda item: item.name.lower()):
-            lines.append(f"- {dep.name} {dep.version}")
+        lines.extend(f"- {dep.name} {dep.version}" for dep in _load_dependencies())
         return "\n".join(lines)
 
     def _build_kofi_button(self) -> QtWidgets.QToolButton:
@@ -245,16 +467,12 @@ class AboutDialog(QtWidgets.QDialog):
         )
         button.clicked.connect(self._open_kofi)
 
-        badge_width = 120
-        badge_pixmap = QtGui.QPixmap(str(KOFI_LOCAL_IMAGE))
-        if not badge_pixmap.isNull():
-            scaled = badge_pixmap.scaledToWidth(
-                badge_width,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            button.setIcon(QtGui.QIcon(scaled))
-            button.setIconSize(scaled.size())
-            button.setFixedSize(scaled.size())
+        badge = _kofi_icon(120)
+        if badge is not None:
+            icon, size = badge
+            button.setIcon(icon)
+            button.setIconSize(size)
+            button.setFixedSize(size)
         else:
             button.setText("Support on Ko-fi")
         return button
@@ -264,142 +482,7 @@ class AboutDialog(QtWidgets.QDialog):
         QtGui.QDesktopServices.openUrl(QtCore.QUrl(link_target))
 
     def _resolve_app_version(self) -> str:
-        version = __version__
-        if version:
-            return version
-        return self._package_version("shelldeck")
-
-    def _resolve_build_info(self) -> str | None:
-        build = os.environ.get("SHELLDECK_BUILD", "").strip()
-        commit = os.environ.get("SHELLDECK_COMMIT", "").strip()
-        branch = os.environ.get("SHELLDECK_BRANCH", "").strip()
-        parts = [item for item in [build, commit, branch] if item]
-        if not parts:
-            return None
-        return " / ".join(parts)
-
-    def _load_dependencies(self) -> list[DependencyInfo]:
-        dependencies: list[DependencyInfo] = []
-        root = self._find_repo_root(Path(__file__).resolve())
-        if root is None:
-            return dependencies
-
-        pyproject_path = root / "pyproject.toml"
-        if pyproject_path.exists():
-            deps = self._parse_pyproject_dependencies(pyproject_path)
-            dependencies.extend(self._resolve_dependencies(deps, "pyproject.toml"))
-
-        for req_path in sorted(root.glob("requirements*.txt")):
-            reqs = self._parse_requirements(req_path)
-            dependencies.extend(self._resolve_dependencies(reqs, req_path.name))
-
-        return self._dedupe_dependencies(dependencies)
-
-    def _parse_pyproject_dependencies(self, path: Path) -> list[str]:
-        try:
-            content = path.read_text(encoding="utf-8")
-        except OSError:
-            return []
-        return self._extract_toml_array(content, "dependencies", section="project")
-
-    def _parse_requirements(self, path: Path) -> list[str]:
-        try:
-            content = path.read_text(encoding="utf-8")
-        except OSError:
-            return []
-        requirements = []
-        for line in content.splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            requirements.append(stripped)
-        return requirements
-
-    def _resolve_dependencies(self, specs: list[str], source: str) -> list[DependencyInfo]:
-        resolved: list[DependencyInfo] = []
-        for spec in specs:
-            name = self._parse_requirement_name(spec)
-            if not name:
-                continue
-            resolved.append(
-                DependencyInfo(
-                    name=name,
-                    version=self._package_version(name),
-                    source=source,
-                )
-            )
-        return resolved
-
-    def _dedupe_dependencies(self, deps: list[DependencyInfo]) -> list[DependencyInfo]:
-        seen: dict[str, DependencyInfo] = {}
-        for dep in deps:
-            key = dep.name.lower()
-            if key not in seen:
-                seen[key] = dep
-        return list(seen.values())
-
-    def _parse_requirement_name(self, spec: str) -> str:
-        match = re.match(r"^[A-Za-z0-9_.-]+", spec.strip())
-        return match.group(0) if match else ""
-
-    def _extract_toml_array(self, content: str, key: str, section: str) -> list[str]:
-        in_section = False
-        collecting = False
-        buffer: list[str] = []
-        header = f"[{section}]"
-        for line in content.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("[") and stripped.endswith("]"):
-                in_section = stripped == header
-                if not in_section:
-                    collecting = False
-                    buffer = []
-                continue
-            if not in_section:
-                continue
-            if not collecting and stripped.startswith(f"{key}"):
-                parts = line.split("=", 1)
-                if len(parts) < 2:
-                    continue
-                remainder = parts[1].strip()
-                if "[" in remainder:
-                    buffer.append(remainder)
-                    if "]" in remainder:
-                        collecting = False
-                        break
-                    collecting = True
-                continue
-            if collecting:
-                buffer.append(line)
-                if "]" in line:
-                    collecting = False
-                    break
-        if not buffer:
-            return []
-        raw = "\n".join(buffer)
-        start = raw.find("[")
-        end = raw.rfind("]")
-        if start == -1 or end == -1:
-            return []
-        try:
-            value = ast.literal_eval(raw[start : end + 1])
-        except (SyntaxError, ValueError):
-            return []
-        if not isinstance(value, list):
-            return []
-        return [item for item in value if isinstance(item, str)]
-
-    def _package_version(self, package: str) -> str:
-        try:
-            return metadata.version(package)
-        except metadata.PackageNotFoundError:
-            return "unknown"
-
-    def _find_repo_root(self, start: Path) -> Path | None:
-        for parent in [start] + list(start.parents):
-            if (parent / "pyproject.toml").exists():
-                return parent
-        return None
+        return __version__ or _package_version("shelldeck")
 
     def _log_path(self) -> Path:
         cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
@@ -49,8 +49,11 @@ class HostDialog(QtWidgets.QDialog):
         self.notes_edit.setFixedHeight(90)
 
         self.group_combo = QtWidgets.QComboBox()
-        for group in groups:
-            self.group_combo.addItem(group.name, userData=group.id)
+        self.group_combo.blockSignals(True)
+        self.group_combo.addItems([group.name for group in groups])
+        for index, group in enumerate(groups):
+            self.group_combo.setItemData(index, group.id)
+        self.group_combo.blockSignals(False)
 
         form.addRow("Name", self.name_edit)
         form.addRow("Host", self.hostname_edit)
@@ -1,14 +1,69 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable
+
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from ...data import Repository, export_json, import_json
+from ...data import Repository, build_export_data, import_json, write_export_data
 from ...data.models import Host
-from ...ssh_config import list_ssh_config_entries
+from ...ssh_config import SshConfigEntry, list_ssh_config_entries
 from ..ssh_agent_status import AgentState, KeyInfo, SshAgentStatus, StatusSnapshot
 from ..theme import DEFAULT_ACCENT, DEFAULT_MODE, ThemeConfig
 from .ssh_import_dialog import SshImportDialog
 
+_DOT_COLORS = {
+    AgentState.OFF: "#64748b",
+    AgentState.OK_KEYS: "#22c55e",
+    AgentState.OK_NO_KEYS: "#facc15",
+    AgentState.ERROR: "#ef4444",
+}
+_HEADLINES = {
+    AgentState.OK_KEYS: "SSH agent reachable, keys loaded",
+    AgentState.OK_NO_KEYS: "SSH agent reachable, no keys loaded",
+    AgentState.OFF: "SSH agent usage disabled",
+}
+
+
+@lru_cache(maxsize=1)
+def _mode_model() -> QtCore.QStringListModel:
+    return QtCore.QStringListModel(["dark", "light"])
+
+
+class _SshConfigLoadWorker(QtCore.QObject, QtCore.QRunnable):
+    finished = QtCore.Signal(object, str)
+
+    def __init__(self) -> None:
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+
+    def run(self) -> None:
+        try:
+            entries = list_ssh_config_entries()
+        except Exception as exc:
+            self.finished.emit([], str(exc))
+            return
+        self.finished.emit(entries, "")
+
+
+class _JsonExportWorker(QtCore.QObject, QtCore.QRunnable):
+    finished = QtCore.Signal(str)
+
+    def __init__(self, data: dict, path: str) -> None:
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self._data = data
+        self._path = path
+
+    def run(self) -> None:
+        try:
+            write_export_data(self._data, self._path)
+        except Exception as exc:
+            self.finished.emit(str(exc))
+            return
+        self.finished.emit("")
+
 
 class SettingsDialog(QtWidgets.QDialog):
     theme_changed = QtCore.Signal(ThemeConfig)
@@ -28,8 +83,20 @@ class SettingsDialog(QtWidgets.QDialog):
         self.resize(820, 620)
 
         self._accent = QtGui.QColor(current.accent)
+        self._accent_hex = self._accent.name()
+        self._color_dialog: QtWidgets.QColorDialog | None = None
         self._repo = repository
         self._ssh_agent_tooltip = ""
+        self._ssh_dot_color = "#64748b"
+        self._ssh_tab_index = -1
+        self._ssh_tab_visible = False
+        self._pending_snapshot: StatusSnapshot | None = None
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(50)
+        self._render_timer.timeout.connect(self._render_pending_status)
+        self._ssh_config_worker: _SshConfigLoadWorker | None = None
+        self._export_worker: _JsonExportWorker | None = None
         self._ssh_agent_status = SshAgentStatus(self)
         self._ssh_agent_status.status_changed.connect(self._apply_ssh_agent_status)
 
@@ -41,10 +108,26 @@ class SettingsDialog(QtWidgets.QDialog):
         tabs.setDocumentMode(True)
         tabs.setTabPosition(QtWidgets.QTabWidget.TabPosition.North)
         tabs.setToolTip("Navigate settings categories")
-        tabs.addTab(self._build_appearance_tab(current), "Appearance")
-        tabs.addTab(self._build_ssh_agent_tab(), "SSH Agent")
-        tabs.addTab(self._build_data_tab(), "Data")
-        tabs.addTab(self._build_layout_tab(), "Layout")
+        self._tab_builders: dict[
+            int, tuple[QtWidgets.QVBoxLayout, Callable[[], QtWidgets.QWidget]]
+        ] = {}
+        for label, builder in (
+            ("Appearance", lambda: self._build_appearance_tab(current)),
+            ("SSH Agent", self._build_ssh_agent_tab),
+            ("Data", self._build_data_tab),
+            ("Layout", self._build_layout_tab),
+        ):
+            placeholder = QtWidgets.QWidget()
+            placeholder_layout = QtWidgets.QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            index = tabs.addTab(placeholder, label)
+            self._tab_builders[index] = (placeholder_layout, builder)
+            if label == "SSH Agent":
+                self._ssh_tab_index = index
+        self._tabs = tabs
+        tabs.currentChanged.connect(self._ensure_tab)
+        tabs.currentChanged.connect(self._on_current_tab_changed)
+        self._ensure_tab(0)
         layout.addWidget(tabs, 1)
 
         buttons = QtWidgets.QDialogButtonBox(
@@ -61,7 +144,17 @@ class SettingsDialog(QtWidgets.QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
-        QtCore.QTimer.singleShot(0, self._refresh_ssh_agent)
+    def _ensure_tab(self, index: int) -> None:
+        pending = self._tab_builders.pop(index, None)
+        if pending is None:
+            return
+        placeholder_layout, builder = pending
+        placeholder_layout.addWidget(builder())
+
+    def _on_current_tab_changed(self, index: int) -> None:
+        self._ssh_tab_visible = index == self._ssh_tab_index
+        if self._ssh_tab_visible and self._pending_snapshot is not None:
+            self._render_pending_status()
 
     def _build_appearance_tab(self, current: ThemeConfig) -> QtWidgets.QWidget:
         page = QtWidgets.QWidget(self)
@@ -74,8 +167,9 @@ class SettingsDialog(QtWidgets.QDialog):
         form.setFieldGrowthPolicy(QtWidgets.QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
 
         self.mode_combo = QtWidgets.QComboBox()
-        self.mode_combo.addItems(["dark", "light"])
-        self.mode_combo.setCurrentText(current.mode)
+        self.mode_combo.setModel(_mode_model())
+        with QtCore.QSignalBlocker(self.mode_combo):
+            self.mode_combo.setCurrentText(current.mode)
         self.mode_combo.setToolTip("Switch between dark and light mode")
         self.mode_combo.currentTextChanged.connect(self._emit_theme_change)
 
@@ -126,12 +220,16 @@ class SettingsDialog(QtWidgets.QDialog):
 
         self.ssh_details = QtWidgets.QPlainTextEdit()
         self.ssh_details.setReadOnly(True)
+        self.ssh_details.setUndoRedoEnabled(False)
+        self.ssh_details.setMaximumBlockCount(200)
+        self.ssh_details.document().setDocumentMargin(4)
         self.ssh_details.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
         self.ssh_details.setPlaceholderText("SSH agent details are shown here.")
         self.ssh_details.setToolTip("Detailed SSH agent diagnostics and key list")
         status_group_layout.addWidget(self.ssh_details, 1)
 
         page_layout.addWidget(status_group, 1)
+        QtCore.QTimer.singleShot(0, self._refresh_ssh_agent)
         return page
 
     def _build_data_tab(self) -> QtWidgets.QWidget:
@@ -187,15 +285,22 @@ class SettingsDialog(QtWidgets.QDialog):
         return page
 
     def _pick_accent(self) -> None:
-        color = QtWidgets.QColorDialog.getColor(self._accent, self, "Pick accent color")
+        if self._color_dialog is None:
+            self._color_dialog = QtWidgets.QColorDialog(self)
+            self._color_dialog.setWindowTitle("Pick accent color")
+        self._color_dialog.setCurrentColor(self._accent)
+        if self._color_dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return
+        color = self._color_dialog.currentColor()
         if not color.isValid():
             return
         self._accent = color
+        self._accent_hex = color.name()
         self._update_accent_button()
         self._emit_theme_change()
 
     def _update_accent_button(self) -> None:
-        self.accent_button.setStyleSheet(f"background: {self._accent.name()}; color: #0f172a;")
+        self.accent_button.setStyleSheet(f"background: {self._accent_hex}; color: #0f172a;")
 
     def _apply(self) -> None:
         self.accept()
@@ -217,7 +322,7 @@ class SettingsDialog(QtWidgets.QDialog):
 
     def _emit_theme_change(self) -> None:
         mode = self.mode_combo.currentText() or DEFAULT_MODE
-        accent = self._accent.name() or DEFAULT_ACCENT
+        accent = self._accent_hex or DEFAULT_ACCENT
         self.theme_changed.emit(ThemeConfig(mode=mode, accent=accent))
 
     def _refresh_ssh_agent(self) -> None:
@@ -229,26 +334,29 @@ class SettingsDialog(QtWidgets.QDialog):
         QtGui.QGuiApplication.clipboard().setText(self._ssh_agent_tooltip)
 
     def _apply_ssh_agent_status(self, snapshot: StatusSnapshot) -> None:
-        color_map = {
-            AgentState.OFF: "#64748b",
-            AgentState.OK_KEYS: "#22c55e",
-            AgentState.OK_NO_KEYS: "#facc15",
-            AgentState.ERROR: "#ef4444",
-        }
-        dot_color = color_map.get(snapshot.state, "#64748b")
-        self.ssh_status_dot.setStyleSheet(f"background: {dot_color}; border-radius: 5px;")
-
-        if snapshot.state is AgentState.OK_KEYS:
-            headline = "SSH agent reachable, keys loaded"
-        elif snapshot.state is AgentState.OK_NO_KEYS:
-            headline = "SSH agent reachable, no keys loaded"
-        elif snapshot.state is AgentState.OFF:
-            headline = "SSH agent usage disabled"
-        else:
-            headline = "SSH agent issue detected"
-        self.ssh_status_label.setText(headline)
+        self._pending_snapshot = snapshot
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _render_pending_status(self) -> None:
+        snapshot = self._pending_snapshot
+        if snapshot is None:
+            return
+        dot_color = _DOT_COLORS.get(snapshot.state, "#64748b")
+        if dot_color != self._ssh_dot_color:
+            self._ssh_dot_color = dot_color
+            self.ssh_status_dot.setStyleSheet(f"background: {dot_color}; border-radius: 5px;")
 
+        headline = _HEADLINES.get(snapshot.state, "SSH agent issue detected")
+        if self.ssh_status_label.text() != headline:
+            self.ssh_status_label.setText(headline)
+
+        if not self._ssh_tab_visible:
+            return
+        self._pending_snapshot = None
         tooltip = self._build_ssh_agent_tooltip(snapshot)
+        if tooltip == self._ssh_agent_tooltip:
+            return
         self._ssh_agent_tooltip = tooltip
         self.ssh_status_label.setToolTip(tooltip)
         self.ssh_status_dot.setToolTip(tooltip)
@@ -259,41 +367,40 @@ class SettingsDialog(QtWidgets.QDialog):
         reachable = "Yes" if snapshot.agent_reachable else "No"
         keys_loaded = str(snapshot.keys_loaded) if snapshot.keys_loaded is not None else "n/a"
         sock_value = snapshot.ssh_auth_sock or "not set"
-        lines = [
-            "SSH Agent",
-            "--------",
-            f"Use agent: {use_state}",
-            f"SSH_AUTH_SOCK: {sock_value}",
-            f"Reachable: {reachable}",
-            f"Keys loaded: {keys_loaded}",
+        parts = [
+            "SSH Agent\n"
+            "--------\n"
+            f"Use agent: {use_state}\n"
+            f"SSH_AUTH_SOCK: {sock_value}\n"
+            f"Reachable: {reachable}\n"
+            f"Keys loaded: {keys_loaded}"
         ]
 
         if snapshot.detected_while_off:
-            lines.append("Detected while off: yes")
+            parts.append("Detected while off: yes")
 
         if snapshot.keys:
-            lines.append("Fingerprints:")
-            lines.extend(self._format_key_lines(snapshot.keys))
+            parts.append("Fingerprints:")
+            parts.extend(self._format_key_lines(snapshot.keys))
 
         last_check = snapshot.last_checked.strftime("%Y-%m-%d %H:%M:%S")
-        lines.append(f"Last check: {last_check}")
-        lines.append(f"Error: {snapshot.last_error or '(none)'}")
-        return "\n".join(lines)
+        parts.append(f"Last check: {last_check}\nError: {snapshot.last_error or '(none)'}")
+        return "\n".join(parts)
 
     def _format_key_lines(self, keys: tuple[KeyInfo, ...]) -> list[str]:
         max_keys = 12
-        lines: list[str] = []
-        for key in keys[:max_keys]:
-            if key.comment:
-                lines.append(f"  {key.fingerprint} ({key.comment})")
-            else:
-                lines.append(f"  {key.fingerprint}")
+        lines = [
+            f"  {key.fingerprint} ({key.comment})" if key.comment else f"  {key.fingerprint}"
+            for key in keys[:max_keys]
+        ]
         remaining = len(keys) - max_keys
         if remaining > 0:
             lines.append(f"  ... ({remaining} more)")
         return lines
 
     def _export_json(self) -> None:
+        if self._export_worker is not None:
+            return
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Export JSON",
@@ -305,10 +412,23 @@ class SettingsDialog(QtWidgets.QDialog):
         settings = {
             "theme": {
                 "mode": self.mode_combo.currentText() or DEFAULT_MODE,
-                "accent": self._accent.name() or DEFAULT_ACCENT,
+                "accent": self._accent_hex or DEFAULT_ACCENT,
             }
         }
-        export_json(self._repo, path, settings=settings)
+        worker = _JsonExportWorker(build_export_data(self._repo, settings), path)
+        self._export_worker = worker
+        self.export_json_button.setEnabled(False)
+        self.export_json_button.setText("Exporting JSON...")
+        worker.finished.connect(self._on_json_exported, QtCore.Qt.ConnectionType.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_json_exported(self, error: str) -> None:
+        self._export_worker = None
+        self.export_json_button.setEnabled(True)
+        self.export_json_button.setText("Export JSON...")
+        if error:
+            QtWidgets.QMessageBox.warning(self, "Export failed", f"Could not write JSON:\n{error}")
+            return
         QtWidgets.QMessageBox.information(self, "Export complete", "JSON export saved.")
 
     def _import_json(self) -> None:
@@ -331,7 +451,28 @@ class SettingsDialog(QtWidgets.QDialog):
         self.data_changed.emit()
 
     def _import_from_ssh_config(self) -> None:
-        entries = list_ssh_config_entries()
+        if self._ssh_config_worker is not None:
+            return
+        worker = _SshConfigLoadWorker()
+        self._ssh_config_worker = worker
+        self.import_ssh_button.setEnabled(False)
+        self.import_ssh_button.setText("Reading ~/.ssh/config...")
+        worker.finished.connect(
+            self._on_ssh_entries_loaded, QtCore.Qt.ConnectionType.QueuedConnection
+        )
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_ssh_entries_loaded(self, entries: list[SshConfigEntry], error: str) -> None:
+        self._ssh_config_worker = None
+        self.import_ssh_button.setEnabled(True)
+        self.import_ssh_button.setText("Import from SSH config...")
+        if not self.isVisible():
+            return
+        if error:
+            QtWidgets.QMessageBox.warning(
+                self, "SSH config", f"Could not read SSH config:\n{error}"
+            )
+            return
         if not entries:
             QtWidgets.QMessageBox.information(self, "No entries", "No SSH config entries found.")
             return
@@ -342,49 +483,40 @@ class SettingsDialog(QtWidgets.QDialog):
         if not selected:
             return
         group = self._repo.get_or_create_group("Imported")
-        inserted = 0
-        updated = 0
-        for entry in selected:
-            existing = self._repo.find_host_for_merge(group.id, entry.hostname, entry.alias)
-            if existing:
-                updated_host = Host(
-                    id=existing.id,
-                    group_id=group.id,
-                    name=entry.alias,
-                    hostname=entry.hostname,
-                    port=entry.port or existing.port,
-                    user=entry.user or existing.user,
-                    identity_file=entry.identity_file or existing.identity_file,
-                    ssh_config_host_alias=entry.alias,
-                    notes=existing.notes,
-                    tags=existing.tags,
-                    favorite=existing.favorite,
-                    color=existing.color,
-                    tag=existing.tag,
-                )
-                self._repo.update_host(updated_host)
-                updated += 1
-            else:
-                host = Host(
-                    id=0,
-                    group_id=group.id,
-                    name=entry.alias,
-                    hostname=entry.hostname,
-                    port=entry.port,
-                    user=entry.user,
-                    identity_file=entry.identity_file,
-                    ssh_config_host_alias=entry.alias,
-                    notes=None,
-                    tags=[],
-                    favorite=False,
-                    color=None,
-                    tag=None,
-                )
-                self._repo.create_host(host)
-                inserted += 1
+        hosts = [
+            Host(
+                id=0,
+                group_id=group.id,
+                name=entry.alias,
+                hostname=entry.hostname,
+                port=entry.port,
+                user=entry.user,
+                identity_file=entry.identity_file,
+                ssh_config_host_alias=entry.alias,
+                notes=None,
+                tags=[],
+                favorite=False,
+                color=None,
+                tag=None,
+            )
+            for entry in selected
+        ]
+        inserted, updated = self._repo.import_hosts(group.id, hosts, self._merge_imported_host)
         QtWidgets.QMessageBox.information(
             self,
             "Import complete",
             f"Imported: {inserted}\nUpdated: {updated}",
         )
         self.data_changed.emit()
+
+    def _merge_imported_host(self, existing: Host, imported: Host) -> Host:
+        return replace(
+            existing,
+            group_id=imported.group_id,
+            name=imported.name,
+            hostname=imported.hostname,
+            port=imported.port or existing.port,
+            user=imported.user or existing.user,
+            identity_file=imported.identity_file or existing.identity_file,
+            ssh_config_host_alias=imported.ssh_config_host_alias,
+        )
@@ -1,9 +1,121 @@
 from __future__ import annotations
 
+from typing import Any
+
 from PySide6 import QtCore, QtWidgets
 
 from ...ssh_config import SshConfigEntry
 
+_ROOT_INDEX = QtCore.QModelIndex()
+
+
+class SshImportModel(QtCore.QAbstractTableModel):
+    _HEADERS = ("Import", "Alias", "Hostname", "User", "Port", "Identity", "ProxyJump")
+
+    def __init__(
+        self,
+        entries: list[SshConfigEntry],
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._entries = entries
+        self._checked = bytearray(b"\x01" * len(entries))
+
+    def rowCount(
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            if role == QtCore.Qt.ItemDataRole.CheckStateRole:
+                return (
+                    QtCore.Qt.CheckState.Checked
+                    if self._checked[row]
+                    else QtCore.Qt.CheckState.Unchecked
+                )
+            return None
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        entry = self._entries[row]
+        if column == 1:
+            return entry.alias
+        if column == 2:
+            return entry.hostname
+        if column == 3:
+            return entry.user or ""
+        if column == 4:
+            return str(entry.port or "")
+        if column == 5:
+            return entry.identity_file or ""
+        return entry.proxy_jump or ""
+
+    def setData(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        value: Any,
+        role: int = QtCore.Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if (
+            not index.isValid()
+            or index.column() != 0
+            or role != QtCore.Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+        checked = QtCore.Qt.CheckState(value) == QtCore.Qt.CheckState.Checked
+        self._checked[index.row()] = 1 if checked else 0
+        self.dataChanged.emit(index, index, [QtCore.Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def set_all_checked(self, checked: bool) -> None:
+        if not self._entries:
+            return
+        self._checked = bytearray((b"\x01" if checked else b"\x00") * len(self._entries))
+        self.dataChanged.emit(
+            self.index(0, 0),
+            self.index(len(self._entries) - 1, 0),
+            [QtCore.Qt.ItemDataRole.CheckStateRole],
+        )
+
+    def flags(self, index: QtCore.QModelIndex | QtCore.QPersistentModelIndex) -> QtCore.Qt.ItemFlag:
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        if index.column() == 0:
+            return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+        return QtCore.Qt.ItemFlag.ItemIsEnabled
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self._HEADERS)
+        ):
+            return self._HEADERS[section]
+        return None
+
+    def selected_entries(self) -> list[SshConfigEntry]:
+        return [
+            entry for entry, checked in zip(self._entries, self._checked, strict=True) if checked
+        ]
+
 
 class SshImportDialog(QtWidgets.QDialog):
     def __init__(
@@ -15,39 +127,30 @@ class SshImportDialog(QtWidgets.QDialog):
         self.setWindowTitle("Import from SSH config")
         self.setModal(True)
         self._entries = entries
+        self._model = SshImportModel(entries, self)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
 
-        self.table = QtWidgets.QTableWidget(len(entries), 7, self)
-        self.table.setHorizontalHeaderLabels(
-            ["Import", "Alias", "Hostname", "User", "Port", "Identity", "ProxyJump"]
-        )
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(self._model)
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.horizontalHeader().setResizeContentsPrecision(200)
 
-        for row, entry in enumerate(entries):
-            checkbox_item = QtWidgets.QTableWidgetItem()
-            checkbox_item.setCheckState(QtCore.Qt.CheckState.Checked)
-            self.table.setItem(row, 0, checkbox_item)
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(entry.alias))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(entry.hostname))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(entry.user or ""))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(entry.port or "")))
-            self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(entry.identity_file or ""))
-            self.table.setItem(row, 6, QtWidgets.QTableWidgetItem(entry.proxy_jump or ""))
-
+        self.table.setUpdatesEnabled(False)
         self.table.resizeColumnsToContents()
+        self.table.setUpdatesEnabled(True)
         layout.addWidget(self.table, 1)
 
         toggle_bar = QtWidgets.QHBoxLayout()
         select_all = QtWidgets.QPushButton("Select all")
         select_none = QtWidgets.QPushButton("Select none")
-        select_all.clicked.connect(lambda: self._set_all(QtCore.Qt.CheckState.Checked))
-        select_none.clicked.connect(lambda: self._set_all(QtCore.Qt.CheckState.Unchecked))
+        select_all.clicked.connect(lambda: self._model.set_all_checked(True))
+        select_none.clicked.connect(lambda: self._model.set_all_checked(False))
         toggle_bar.addWidget(select_all)
         toggle_bar.addWidget(select_none)
         toggle_bar.addStretch(1)
@@ -61,16 +164,5 @@ class SshImportDialog(QtWidgets.QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
-    def _set_all(self, state: QtCore.Qt.CheckState) -> None:
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                item.setCheckState(state)
-
     def selected_entries(self) -> list[SshConfigEntry]:
-        selected: list[SshConfigEntry] = []
-        for row, entry in enumerate(self._entries):
-            item = self.table.item(row, 0)
-            if item and item.checkState() == QtCore.Qt.CheckState.Checked:
-                selected.append(entry)
-        return selected
+        return self._model.selected_entries()
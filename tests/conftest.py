@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+from PySide6 import QtWidgets
+
+
+@pytest.fixture(scope="session")
+def qapp() -> Iterator[QtWidgets.QApplication]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_TESTER_PATH = Path(__file__).resolve().parents[1] / "tools" / "flathub_tester.py"
+
+
+@pytest.fixture(scope="module")
+def tester():
+    spec = importlib.util.spec_from_file_location("flathub_tester", _TESTER_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.modules.pop(spec.name, None)
+
+
+def test_ensure_lines_in_file_appends_once(tester, tmp_path) -> None:
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("build/", encoding="utf-8")
+
+    assert tester.ensure_lines_in_file(gitignore, ["build/", ".flathub-test/"]) == [
+        ".flathub-test/"
+    ]
+    assert tester.ensure_lines_in_file(gitignore, ["build/", ".flathub-test/"]) == []
+    assert gitignore.read_text(encoding="utf-8") == "build/\n.flathub-test/\n"
+
+
+def test_index_repo_prunes_root_artifacts_only(tester, tmp_path) -> None:
+    for relative in (
+        "build/top.pyc",
+        "repo/top.flatpak",
+        ".git/objects/git.pyc",
+        ".flathub-test/work.pyc",
+        "src/build/nested.pyc",
+        "src/repo/nested.flatpak",
+        "src/pkg/__pycache__/mod.pyc",
+        "data/app.metainfo.xml",
+    ):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+    index = tester.index_repo(tmp_path, tmp_path / ".flathub-test")
+
+    assert {"build", "repo", ".git", ".flathub-test", "src", "data"} <= index.top_level
+    assert index.pyc_files == (str(tmp_path / "src" / "build" / "nested.pyc"),)
+    assert index.flatpak_files == (str(tmp_path / "src" / "repo" / "nested.flatpak"),)
+    assert index.pycache_dirs == (str(tmp_path / "src" / "pkg" / "__pycache__"),)
+    assert index.assets == (str(tmp_path / "data" / "app.metainfo.xml"),)
+
+
+def test_read_metainfo_fields(tester, tmp_path) -> None:
+    metainfo = tmp_path / "app.metainfo.xml"
+    metainfo.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<component type="desktop-application">
+  <id>io.example.App</id>
+  <metadata_license>CC0-1.0</metadata_license>
+  <project_license>MIT</project_license>
+  <developer id="io.example">
+    <name>Example Dev</name>
+  </developer>
+  <launchable type="desktop-id">io.example.App.desktop</launchable>
+  <url type="homepage">https://example.com</url>
+  <url type="donation">https://example.com/donate</url>
+  <description><p><id>nested</id></p></description>
+</component>
+""",
+        encoding="utf-8",
+    )
+
+    assert tester.read_metainfo_fields(metainfo) == {
+        "id": "io.example.App",
+        "metadata_license": "CC0-1.0",
+        "project_license": "MIT",
+        "developer_id": "io.example",
+        "developer_name": "Example Dev",
+        "launchable": "io.example.App.desktop",
+        "url:homepage": "https://example.com",
+    }
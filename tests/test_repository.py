@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from shelldeck.data import Repository, export_json, import_json
+from shelldeck.data.models import Host
+from shelldeck.data.repository import HostMergeIndex
+
+
+def _host(
+    group_id: int, name: str, hostname: str, port: int | None = None, tags: list[str] | None = None
+) -> Host:
+    return Host(
+        id=0,
+        group_id=group_id,
+        name=name,
+        hostname=hostname,
+        port=port,
+        user=None,
+        identity_file=None,
+        ssh_config_host_alias=None,
+        notes=None,
+        tags=tags or [],
+    )
+
+
+def _merge(existing: Host, imported: Host) -> Host:
+    return replace(existing, hostname=imported.hostname, port=imported.port or existing.port)
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    repository = Repository.open(tmp_path / "shelldeck.db")
+    yield repository
+    repository.close()
+
+
+def test_import_hosts_inserts_updates_and_merges(repo) -> None:
+    group = repo.create_group("Imported")
+    repo.create_host(_host(group.id, "web", "10.0.0.1", tags=["prod"]))
+
+    inserted, updated = repo.import_hosts(
+        group.id,
+        [
+            _host(group.id, "db", "10.0.0.2", tags=["prod", "db"]),
+            _host(group.id, "web", "10.0.0.1", port=2222),
+            _host(group.id, "db", "10.0.0.3", port=5432),
+        ],
+        _merge,
+    )
+
+    assert (inserted, updated) == (1, 2)
+    hosts = {host.name: host for host in repo.list_hosts_for_group(group.id)}
+    assert set(hosts) == {"db", "web"}
+    assert hosts["web"].port == 2222
+    assert hosts["web"].tags == ["prod"]
+    assert hosts["db"].hostname == "10.0.0.3"
+    assert hosts["db"].port == 5432
+    assert hosts["db"].tags == ["db", "prod"]
+
+
+def test_import_hosts_rolls_back_whole_batch(repo) -> None:
+    group = repo.create_group("Imported")
+
+    def failing_merge(existing: Host, imported: Host) -> Host:
+        raise RuntimeError("merge failed")
+
+    with pytest.raises(RuntimeError):
+        repo.import_hosts(
+            group.id,
+            [
+                _host(group.id, "a", "10.0.0.1", tags=["t"]),
+                _host(group.id, "a", "10.0.0.2"),
+            ],
+            failing_merge,
+        )
+
+    assert repo.list_hosts_for_group(group.id) == []
+    assert repo.connection.execute("SELECT COUNT(*) FROM tags").fetchone()[0] == 0
+
+
+def test_merge_index_matches_find_host_for_merge(repo) -> None:
+    group = repo.create_group("Dupes")
+    first = repo.create_host(_host(group.id, "dup", "10.0.0.1"))
+    second = repo.create_host(_host(group.id, "dup", "10.0.0.2"))
+    index = HostMergeIndex(reversed(repo.list_hosts_for_group(group.id)))
+
+    assert index.find(group.id, None, "dup") == first
+    assert repo.find_host_for_merge(group.id, None, "dup") == first
+    assert index.find(group.id, "10.0.0.2", "dup") == second
+
+    renamed = replace(first, name="other")
+    index.replace(first, renamed)
+    assert index.find(group.id, None, "dup") == second
+    assert index.find(group.id, "10.0.0.1", None) == renamed
+
+
+def test_import_json_truncated_file_writes_nothing(repo, tmp_path) -> None:
+    for name in ("A", "B"):
+        group = repo.create_group(name)
+        repo.create_host(_host(group.id, f"host-{name}", f"10.0.1.{len(name)}", tags=["t"]))
+    export_path = tmp_path / "export.json"
+    export_json(repo, export_path)
+    text = export_path.read_text(encoding="utf-8")
+    export_path.write_text(text[: len(text) // 2], encoding="utf-8")
+
+    target = Repository.open(tmp_path / "target.db")
+    with pytest.raises(ValueError):
+        import_json(target, export_path)
+    assert target.list_groups() == []
+
+    export_path.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        import_json(target, export_path)
+    target.close()
@@ -7,14 +7,11 @@ from shelldeck.ui.settings import UiSettings, load_ui_settings, save_ui_settings
 from shelldeck.ui.theme import load_theme_settings
 
 
-def test_db_init_and_settings_load(tmp_path) -> None:
+def test_db_init_and_settings_load(tmp_path, qapp) -> None:
     repo = Repository.open(tmp_path / "shelldeck.db")
     assert repo.list_groups() == []
     repo.close()
 
-    if QtCore.QCoreApplication.instance() is None:
-        QtCore.QCoreApplication([])
-
     settings = QtCore.QSettings(
         str(tmp_path / "settings.ini"),
         QtCore.QSettings.Format.IniFormat,
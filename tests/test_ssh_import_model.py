@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from PySide6 import QtCore
+
+from shelldeck.ssh_config import SshConfigEntry
+from shelldeck.ui.widgets.ssh_import_dialog import SshImportModel
+
+
+def _entry(alias: str) -> SshConfigEntry:
+    return SshConfigEntry(
+        alias=alias,
+        hostname=f"{alias}.example.com",
+        user=None,
+        port=None,
+        identity_file=None,
+        proxy_jump=None,
+    )
+
+
+def test_check_state_toggling(qapp) -> None:
+    entries = [_entry("a"), _entry("b"), _entry("c")]
+    model = SshImportModel(entries)
+    check_role = QtCore.Qt.ItemDataRole.CheckStateRole
+    assert model.selected_entries() == entries
+
+    index = model.index(1, 0)
+    assert model.setData(index, QtCore.Qt.CheckState.Unchecked.value, check_role)
+    assert model.data(index, check_role) == QtCore.Qt.CheckState.Unchecked
+    assert model.selected_entries() == [entries[0], entries[2]]
+    assert not model.setData(model.index(1, 1), QtCore.Qt.CheckState.Checked.value, check_role)
+
+    model.set_all_checked(False)
+    assert model.selected_entries() == []
+    model.set_all_checked(True)
+    assert model.selected_entries() == entries
@@ -7,14 +7,7 @@ from PySide6 import QtWidgets
 from shelldeck.terminal.backend import FallbackBackend, TermQtBackend, create_terminal_backend
 
 
-_APP: QtWidgets.QApplication | None = None
-
-
-def test_terminal_backend_smoke() -> None:
-    global _APP
-    if QtWidgets.QApplication.instance() is None:
-        _APP = QtWidgets.QApplication([])
-
+def test_terminal_backend_smoke(qapp: QtWidgets.QApplication) -> None:
     backend = create_terminal_backend(None)
     assert backend.widget() is not None
 
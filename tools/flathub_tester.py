@@ -12,18 +12,38 @@ Typical usage:
 from __future__ import annotations
 
 import argparse
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache, partial
+import hashlib
+import http.client
 import json
+import os
 from pathlib import Path
 import re
 import shutil
+import stat
 import subprocess
 import sys
-from typing import Any
+import tempfile
+import time
+from typing import Any, Callable, Iterable, Iterator
 from urllib import error as urlerror
 from urllib import parse as urlparse
 from urllib import request as urlrequest
 import xml.etree.ElementTree as ET
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON codec
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional YAML parser
+    yaml = None
+
 
 EXIT_OK = 0
 EXIT_ERRORS = 2
@@ -54,11 +74,94 @@ LINTER_HINTS = {
     ],
 }
 
+GITIGNORE_FIX_PATTERNS = (
+    ".flatpak-builder/",
+    "build/",
+    "repo/",
+    "__pycache__/",
+    "*.pyc",
+    "*.flatpak",
+)
+DEFAULT_WORKDIR = ".flathub-test"
+TOOLING_CACHE_TTL = 15 * 60
+PORCELAIN_V2_FIELDS = {"1": 8, "2": 9, "u": 10}
+BUILDER_RUNTIME = "org.flatpak.Builder"
+SHOW_MANIFEST_PREFIX = (
+    "flatpak",
+    "run",
+    "--command=flatpak-builder",
+    BUILDER_RUNTIME,
+    "--show-manifest",
+)
+LINT_PREFIX = ("flatpak", "run", "--command=flatpak-builder-lint", BUILDER_RUNTIME)
+FLATHUB_BUILD_PREFIX = ("flatpak", "run", "--command=flathub-build", BUILDER_RUNTIME)
+SCAN_ROOT_PRUNED_DIRS = (".flatpak-builder", "build", "repo")
+ASSET_SUFFIXES = (".metainfo.xml", ".desktop", ".svg", ".png")
+LARGE_FILE_BYTES = 50 * 1024 * 1024
+LARGE_FILE_LIMIT = 20
+HARD_PERMISSION_PATTERNS = (
+    "--socket=ssh-auth",
+    "--socket=ssh-agent",
+    "--filesystem=~/.ssh",
+    "--filesystem=home",
+    "--filesystem=~",
+    "--filesystem=/home",
+)
+WARN_PERMISSION_PATTERNS = (
+    "--filesystem=host",
+    "--device=all",
+    "--talk-name=*",
+    "--system-bus",
+    "--filesystem=xdg-run/",
+)
+HARD_PERMISSION_RE = re.compile("|".join(map(re.escape, HARD_PERMISSION_PATTERNS)))
+WARN_PERMISSION_RE = re.compile("|".join(map(re.escape, WARN_PERMISSION_PATTERNS)))
+YAML_REF_RE = re.compile(r"^\s*-\s*([\w./-]+\.(?:json|ya?ml))\s*$", re.MULTILINE)
+APP_ID_KEY_RE = re.compile(r"""(?<![\w-])["']?(?:app-)?id["']?\s*:\s*["']?([A-Za-z0-9._-]+)""")
+METAINFO_FIELDS = (
+    "id",
+    "metadata_license",
+    "project_license",
+    "developer_id",
+    "developer_name",
+    "launchable",
+    "url:homepage",
+    "url:bugtracker",
+)
+LINTER_ID_RE = re.compile(r"\b([a-z0-9]+(?:-[a-z0-9]+){2,})\b")
+
+_MANIFEST_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+_STAT_CACHE: dict[Path, os.stat_result | None] = {}
+_LINT_CACHE: dict[tuple[tuple[str, ...], int], tuple[int, bytes, bytes]] = {}
+
+
+def json_loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> str:
+    if orjson is not None:
+        text: str = orjson.dumps(value).decode("utf-8")
+        return text
+    return json.dumps(value)
+
+
+@dataclass(slots=True)
+class ReportItem:
+    section: str
+    level: str
+    message: str
+    details: str
+    hints: list[str]
+
 
 class Reporter:
     def __init__(self) -> None:
-        self.items: list[dict[str, Any]] = []
+        self.items: list[ReportItem] = []
         self.counts = {"ERROR": 0, "WARN": 0, "OK": 0}
+        self.section_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
 
     def add(
         self,
@@ -68,16 +171,9 @@ class Reporter:
         details: str = "",
         hints: list[str] | None = None,
     ) -> None:
-        self.items.append(
-            {
-                "section": section,
-                "level": level,
-                "message": message,
-                "details": details.strip(),
-                "hints": hints or [],
-            }
-        )
+        self.items.append(ReportItem(section, level, message, details.strip(), hints or []))
         self.counts[level] += 1
+        self.section_counts[section][level] += 1
 
     def ok(self, section: str, message: str, details: str = "") -> None:
         self.add(section, "OK", message, details)
@@ -92,44 +188,102 @@ class Reporter:
     ) -> None:
         self.add(section, "ERROR", message, details, hints)
 
+    def merge(self, other: Reporter) -> None:
+        self.items.extend(other.items)
+        for level, count in other.counts.items():
+            self.counts[level] += count
+        for section, counts in other.section_counts.items():
+            self.section_counts[section].update(counts)
+
     def print(self) -> None:
-        by_section: dict[str, list[dict[str, Any]]] = {}
+        by_section: dict[str, list[ReportItem]] = {}
         for item in self.items:
-            by_section.setdefault(item["section"], []).append(item)
+            by_section.setdefault(item.section, []).append(item)
 
         for section in by_section:
             print(f"\n== {section} ==")
             for item in by_section[section]:
-                print(f"[{item['level']}] {item['message']}")
-                if item["details"]:
-                    for line in item["details"].splitlines():
+                print(f"[{item.level}] {item.message}")
+                if item.details:
+                    for line in item.details.splitlines():
                         print(f"  {line}")
-                if item["hints"]:
+                if item.hints:
                     print("  Fix hints:")
-                    for hint in item["hints"]:
+                    for hint in item.hints:
                         print(f"   - {hint}")
 
 
-def run_cmd(args: list[str], check: bool = False, cwd: Path | None = None) -> tuple[int, str, str]:
+def decode_output(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+def run_cmd(
+    args: list[str], check: bool = False, cwd: Path | None = None
+) -> tuple[int, bytes, bytes]:
     proc = subprocess.run(
         args,
+        executable=find_executable(args[0]),
         cwd=str(cwd) if cwd else None,
-        text=True,
         capture_output=True,
     )
     if check and proc.returncode != 0:
-        raise RuntimeError(f"Command failed ({proc.returncode}): {' '.join(args)}\n{proc.stderr}")
-    return proc.returncode, proc.stdout or "", proc.stderr or ""
+        raise RuntimeError(
+            f"Command failed ({proc.returncode}): {' '.join(args)}\n{decode_output(proc.stderr)}"
+        )
+    return proc.returncode, proc.stdout or b"", proc.stderr or b""
+
+
+def run_cmd_streaming(
+    args: list[str], cwd: Path, log_path: Path, tail_lines: int = 200
+) -> tuple[int, deque[str]]:
+    last_lines: deque[str] = deque(maxlen=tail_lines)
+    with log_path.open("w", encoding="utf-8") as log:
+        proc = subprocess.Popen(
+            args,
+            executable=find_executable(args[0]),
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+        assert proc.stdout is not None
+        with proc.stdout:
+            for line in proc.stdout:
+                log.write(line)
+                last_lines.append(line.rstrip("\n"))
+        rc = proc.wait()
+    return rc, last_lines
+
+
+def cached_stat(path: Path) -> os.stat_result | None:
+    if path not in _STAT_CACHE:
+        try:
+            _STAT_CACHE[path] = os.stat(path)
+        except OSError:
+            _STAT_CACHE[path] = None
+    return _STAT_CACHE[path]
+
+
+def is_regular_file(path: Path) -> bool:
+    result = cached_stat(path)
+    return result is not None and stat.S_ISREG(result.st_mode)
+
+
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> str | None:
+    return shutil.which(name)
 
 
 def detect_tooling() -> dict[str, Any]:
-    flatpak = shutil.which("flatpak")
-    host_builder = shutil.which("flatpak-builder")
-    host_lint = shutil.which("flatpak-builder-lint")
-    host_flathub_build = shutil.which("flathub-build")
+    flatpak = find_executable("flatpak")
+    host_builder = find_executable("flatpak-builder")
+    host_lint = find_executable("flatpak-builder-lint")
+    host_flathub_build = find_executable("flathub-build")
     runtime_builder = False
     if flatpak:
-        rc, _, _ = run_cmd(["flatpak", "info", "org.flatpak.Builder"])
+        rc, _, _ = run_cmd(["flatpak", "info", BUILDER_RUNTIME])
         runtime_builder = rc == 0
 
     return {
@@ -141,15 +295,54 @@ def detect_tooling() -> dict[str, Any]:
     }
 
 
+def tooling_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "shelldeck" / "flathub_tooling.json"
+
+
+def tooling_fingerprint() -> dict[str, Any]:
+    watched = [
+        find_executable("flatpak"),
+        "/var/lib/flatpak/app",
+        os.path.expanduser("~/.local/share/flatpak/app"),
+    ]
+    mtimes = {}
+    for path in watched:
+        if path:
+            info = cached_stat(Path(path))
+            mtimes[path] = info.st_mtime_ns if info else None
+    return {"path": os.environ.get("PATH", ""), "mtimes": mtimes}
+
+
+def load_tooling(refresh: bool = False) -> dict[str, Any]:
+    cache_path = tooling_cache_path()
+    fingerprint = tooling_fingerprint()
+    if not refresh:
+        try:
+            cached = json_loads(cache_path.read_bytes())
+            cached_tooling = cached["tooling"]
+            if (
+                isinstance(cached_tooling, dict)
+                and time.time() - cached["checked_at"] < TOOLING_CACHE_TTL
+                and cached["fingerprint"] == fingerprint
+            ):
+                return cached_tooling
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    tooling = detect_tooling()
+    payload = {"checked_at": time.time(), "fingerprint": fingerprint, "tooling": tooling}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json_dumps(payload), encoding="utf-8")
+    except OSError:
+        pass
+    return tooling
+
+
 def builder_show_manifest_cmd(tooling: dict[str, Any]) -> list[str] | None:
     if tooling["flatpak"] and tooling["runtime_builder"]:
-        return [
-            "flatpak",
-            "run",
-            "--command=flatpak-builder",
-            "org.flatpak.Builder",
-            "--show-manifest",
-        ]
+        return list(SHOW_MANIFEST_PREFIX)
     if tooling["host_builder"]:
         return ["flatpak-builder", "--show-manifest"]
     return None
@@ -157,14 +350,7 @@ def builder_show_manifest_cmd(tooling: dict[str, Any]) -> list[str] | None:
 
 def lint_cmd(tooling: dict[str, Any], kind: str, target: Path) -> list[str] | None:
     if tooling["flatpak"] and tooling["runtime_builder"]:
-        return [
-            "flatpak",
-            "run",
-            "--command=flatpak-builder-lint",
-            "org.flatpak.Builder",
-            kind,
-            str(target),
-        ]
+        return [*LINT_PREFIX, kind, str(target)]
     if tooling["host_lint"]:
         return ["flatpak-builder-lint", kind, str(target)]
     return None
@@ -174,14 +360,7 @@ def flathub_build_cmd(
     tooling: dict[str, Any], repo_path: Path, manifest_path: Path
 ) -> list[str] | None:
     if tooling["flatpak"] and tooling["runtime_builder"]:
-        return [
-            "flatpak",
-            "run",
-            "--command=flathub-build",
-            "org.flatpak.Builder",
-            f"--repo={repo_path}",
-            str(manifest_path),
-        ]
+        return [*FLATHUB_BUILD_PREFIX, f"--repo={repo_path}", str(manifest_path)]
     if tooling["host_flathub_build"]:
         return ["flathub-build", f"--repo={repo_path}", str(manifest_path)]
     return None
@@ -193,18 +372,63 @@ def resolve_manifest_to_json(manifest_path: Path, tooling: dict[str, Any]) -> di
         raise RuntimeError(
             "Neither org.flatpak.Builder nor host flatpak-builder available for --show-manifest"
         )
+    info = cached_stat(manifest_path) or manifest_path.stat()
+    key = (str(manifest_path.resolve()), info.st_mtime_ns, info.st_size)
+    cached = _MANIFEST_CACHE.get(key)
+    if cached is not None:
+        return cached
     rc, out, err = run_cmd(base_cmd + [str(manifest_path)])
     if rc != 0:
-        raise RuntimeError(f"show-manifest failed for {manifest_path}\n{err.strip()}")
+        raise RuntimeError(
+            f"show-manifest failed for {manifest_path}\n{decode_output(err).strip()}"
+        )
     try:
-        return json.loads(out)
+        resolved = json_loads(out)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"show-manifest output is not valid JSON: {exc}") from exc
+    if not isinstance(resolved, dict):
+        raise RuntimeError("show-manifest output is not a JSON object")
+    _MANIFEST_CACHE[key] = resolved
+    return resolved
+
+
+def manifest_cache_key(manifest_path: Path, repo_root: Path, base_cmd: list[str]) -> str:
+    parts = [" ".join(base_cmd)]
+    visited = {manifest_path}
+    queue: deque[Path] = deque([manifest_path])
+    while queue:
+        current = queue.popleft()
+        info = cached_stat(current) or current.stat()
+        parts.append(f"{current}:{info.st_mtime_ns}:{info.st_size}")
+        for dep in extract_dependency_manifest_refs(current, repo_root):
+            if dep in visited or not is_regular_file(dep):
+                continue
+            visited.add(dep)
+            queue.append(dep)
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def resolve_manifest_cached(
+    manifest_path: Path, repo_root: Path, tooling: dict[str, Any], cache_dir: Path | None
+) -> dict[str, Any]:
+    base_cmd = builder_show_manifest_cmd(tooling)
+    if cache_dir is None or not base_cmd:
+        return resolve_manifest_to_json(manifest_path, tooling)
+    cache_file = cache_dir / f"{manifest_cache_key(manifest_path, repo_root, base_cmd)}.json"
+    try:
+        cached = json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        cached = None
+    if isinstance(cached, dict):
+        return cached
+    resolved = resolve_manifest_to_json(manifest_path, tooling)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json_dumps(resolved), encoding="utf-8")
+    return resolved
 
 
 def extract_linter_ids(text: str) -> list[str]:
-    ids = sorted(set(re.findall(r"\b([a-z0-9]+(?:-[a-z0-9]+)+)\b", text)))
-    return [item for item in ids if item.count("-") >= 2]
+    return sorted(dict.fromkeys(LINTER_ID_RE.findall(text)))
 
 
 def compact_output(stdout: str, stderr: str, max_lines: int = 12) -> str:
@@ -219,30 +443,69 @@ def compact_output(stdout: str, stderr: str, max_lines: int = 12) -> str:
     return "\n".join(lines[:max_lines] + [f"... ({len(lines) - max_lines} more lines)"])
 
 
+def read_manifest_app_id(manifest_path: Path) -> str | None:
+    data: Any = None
+    try:
+        if manifest_path.suffix.lower() == ".json":
+            data = json_loads(manifest_path.read_bytes())
+        elif yaml is not None:
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(manifest_path, "rb") as handle:
+                data = yaml.load(handle, Loader=loader)
+    except Exception:
+        data = None
+    if isinstance(data, dict):
+        value = data.get("app-id") or data.get("id")
+        return str(value) if value else None
+
+    try:
+        with open(manifest_path, encoding="utf-8", errors="ignore") as handle:
+            for line in handle:
+                match = APP_ID_KEY_RE.search(line)
+                if match:
+                    return match.group(1)
+    except OSError:
+        pass
+    return None
+
+
 def detect_manifest(
     repo_root: Path, tooling: dict[str, Any], preferred_appid: str | None
 ) -> tuple[Path | None, str | None]:
-    root_candidates = sorted(
-        [p for ext in ("*.yml", "*.yaml", "*.json") for p in repo_root.glob(ext) if p.is_file()]
-    )
+    with os.scandir(repo_root) as entries:
+        names = {
+            entry.name
+            for entry in entries
+            if entry.name.endswith((".yml", ".yaml", ".json")) and entry.is_file()
+        }
     if preferred_appid:
         for suffix in (".yml", ".yaml", ".json"):
-            preferred = repo_root / f"{preferred_appid}{suffix}"
-            if preferred.exists():
-                return preferred.resolve(), None
+            if f"{preferred_appid}{suffix}" in names:
+                return (repo_root / f"{preferred_appid}{suffix}").resolve(), None
+    root_candidates = [repo_root / name for name in sorted(names)]
 
-    valid: list[Path] = []
-    problems: list[str] = []
-    for candidate in root_candidates:
+    def resolve_candidate(candidate: Path) -> tuple[Path, dict[str, Any] | RuntimeError]:
         try:
-            resolved = resolve_manifest_to_json(candidate, tooling)
-            if isinstance(resolved, dict) and resolved.get("app-id"):
-                valid.append(candidate.resolve())
+            return candidate, resolve_manifest_to_json(candidate, tooling)
         except RuntimeError as exc:
-            problems.append(f"{candidate.name}: {exc}")
+            return candidate, exc
+
+    declared = [path for path in root_candidates if read_manifest_app_id(path)]
+    results: list[tuple[Path, dict[str, Any] | RuntimeError]] = []
+    if declared:
+        with ThreadPoolExecutor(max_workers=min(8, len(declared))) as executor:
+            results = list(executor.map(resolve_candidate, declared))
+
+    valid: list[Path] = []
+    problems: list[str] = []
+    for candidate, resolved in results:
+        if isinstance(resolved, RuntimeError):
+            problems.append(f"{candidate.name}: {resolved}")
+        elif isinstance(resolved, dict) and resolved.get("app-id"):
+            valid.append(candidate)
 
     if len(valid) == 1:
-        return valid[0], None
+        return valid[0].resolve(), None
     if len(valid) == 0:
         if not root_candidates:
             return None, "No manifest found in repo root (*.yml/*.yaml/*.json)."
@@ -253,58 +516,167 @@ def detect_manifest(
     return None, f"Multiple valid root manifests found; pass --manifest.\n{listed}"
 
 
-def find_metainfo(repo_root: Path, app_id: str | None) -> Path | None:
-    if app_id:
-        patterns = [
-            f"data/**/{app_id}.metainfo.xml",
-            f"**/share/metainfo/{app_id}.metainfo.xml",
-            f"**/{app_id}.metainfo.xml",
-        ]
-        for pattern in patterns:
-            found = sorted(repo_root.glob(pattern))
-            if found:
-                return found[0].resolve()
-    fallback = sorted(repo_root.glob("**/*.metainfo.xml"))
-    if fallback:
-        return fallback[0].resolve()
-    return None
+@dataclass(frozen=True)
+class AssetScan:
+    metainfo: Path | None
+    desktop: Path | None
+    icon: Path | None
+
+
+@dataclass(frozen=True, eq=False)
+class RepoIndex:
+    root: Path
+    top_level: frozenset[str]
+    assets: tuple[str, ...]
+    pycache_dirs: tuple[str, ...]
+    pyc_files: tuple[str, ...]
+    flatpak_files: tuple[str, ...]
+    large_files: tuple[str, ...]
+
+
+def index_repo(repo_root: Path, workdir: Path | None = None) -> RepoIndex:
+    root = os.fspath(repo_root)
+    top_level: list[str] = []
+    assets: list[str] = []
+    pycache_dirs: list[str] = []
+    pyc_files: list[str] = []
+    flatpak_files: list[str] = []
+    large_files: list[str] = []
+    pruned = {os.path.join(root, name) for name in SCAN_ROOT_PRUNED_DIRS}
+    if workdir is not None:
+        pruned.add(os.fspath(workdir))
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if directory == root:
+                        top_level.append(name)
+                    if entry.is_dir(follow_symlinks=False):
+                        if name == "__pycache__":
+                            pycache_dirs.append(entry.path)
+                        elif name != ".git" and entry.path not in pruned:
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if name.endswith(".pyc"):
+                        pyc_files.append(entry.path)
+                    elif name.endswith(".flatpak"):
+                        flatpak_files.append(entry.path)
+                    elif name.endswith(ASSET_SUFFIXES):
+                        assets.append(entry.path)
+                    if len(large_files) > LARGE_FILE_LIMIT:
+                        continue
+                    try:
+                        if entry.stat(follow_symlinks=False).st_size >= LARGE_FILE_BYTES:
+                            large_files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return RepoIndex(
+        root=repo_root,
+        top_level=frozenset(top_level),
+        assets=tuple(assets),
+        pycache_dirs=tuple(pycache_dirs),
+        pyc_files=tuple(pyc_files),
+        flatpak_files=tuple(flatpak_files),
+        large_files=tuple(large_files),
+    )
 
 
-def find_desktop_and_icon(repo_root: Path, app_id: str | None) -> tuple[Path | None, Path | None]:
-    desktops = sorted(repo_root.glob("**/*.desktop"))
-    icon_candidates = sorted(repo_root.glob("**/*.svg")) + sorted(repo_root.glob("**/*.png"))
+@lru_cache(maxsize=None)
+def scan_assets(index: RepoIndex, app_id: str | None) -> AssetScan:
+    metainfo_name = f"{app_id}.metainfo.xml" if app_id else None
+    icon_prefix = f"{app_id}." if app_id else None
+    root_depth = len(os.fspath(index.root).split(os.sep))
+    best_metainfo: tuple[int, list[str]] | None = None
+    best_desktop: tuple[int, list[str]] | None = None
+    best_icon: tuple[int, int, list[str]] | None = None
+
+    for asset in index.assets:
+        parts = asset.split(os.sep)
+        filename = parts[-1]
+        if filename.endswith(".metainfo.xml"):
+            rank = 3
+            if filename == metainfo_name:
+                if parts[root_depth] == "data":
+                    rank = 0
+                elif parts[-3:-1] == ["share", "metainfo"]:
+                    rank = 1
+                else:
+                    rank = 2
+            if best_metainfo is None or (rank, parts) < best_metainfo:
+                best_metainfo = (rank, parts)
+        elif filename.endswith(".desktop"):
+            rank = 0 if app_id and filename == f"{app_id}.desktop" else 1
+            if best_desktop is None or (rank, parts) < best_desktop:
+                best_desktop = (rank, parts)
+        else:
+            preferred = icon_prefix and filename.startswith(icon_prefix)
+            key = (0 if preferred else 1, 0 if filename.endswith(".svg") else 1, parts)
+            if best_icon is None or key < best_icon:
+                best_icon = key
+
+    def to_path(parts: list[str]) -> Path:
+        return Path(os.sep.join(parts)).resolve()
+
+    return AssetScan(
+        metainfo=to_path(best_metainfo[1]) if best_metainfo else None,
+        desktop=to_path(best_desktop[1]) if best_desktop else None,
+        icon=to_path(best_icon[2]) if best_icon else None,
+    )
 
-    desktop = None
-    if app_id:
-        preferred = [p for p in desktops if p.name == f"{app_id}.desktop"]
-        if preferred:
-            desktop = preferred[0].resolve()
-    if not desktop and desktops:
-        desktop = desktops[0].resolve()
 
-    icon = None
+def find_metainfo(index: RepoIndex, app_id: str | None) -> Path | None:
     if app_id:
-        preferred_icon = [
-            p for p in icon_candidates if p.stem == app_id or p.name.startswith(app_id + ".")
-        ]
-        if preferred_icon:
-            icon = preferred_icon[0].resolve()
-    if not icon and icon_candidates:
-        icon = icon_candidates[0].resolve()
-    return desktop, icon
+        for candidate in (
+            index.root / "data" / f"{app_id}.metainfo.xml",
+            index.root / "share" / "metainfo" / f"{app_id}.metainfo.xml",
+        ):
+            if is_regular_file(candidate):
+                return candidate.resolve()
+    return scan_assets(index, app_id).metainfo
 
 
-def ensure_line_in_file(file_path: Path, line: str) -> bool:
+def find_desktop_and_icon(index: RepoIndex, app_id: str | None) -> tuple[Path | None, Path | None]:
+    scan = scan_assets(index, app_id)
+    return scan.desktop, scan.icon
+
+
+def ensure_lines_in_file(file_path: Path, lines: Iterable[str]) -> list[str]:
     existing = ""
     if file_path.exists():
         existing = file_path.read_text(encoding="utf-8", errors="ignore")
-    lines = [item.strip() for item in existing.splitlines()]
-    if line.strip() in lines:
-        return False
+    present = {item.strip() for item in existing.splitlines()}
+    added: list[str] = []
+    for line in lines:
+        if line.strip() not in present:
+            present.add(line.strip())
+            added.append(line)
+    if not added:
+        return added
+
     if existing and not existing.endswith("\n"):
         existing += "\n"
-    file_path.write_text(existing + f"{line}\n", encoding="utf-8")
-    return True
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=file_path.parent, delete=False
+    ) as handle:
+        handle.write(existing + "".join(f"{line}\n" for line in added))
+    if file_path.exists():
+        shutil.copymode(file_path, handle.name)
+    else:
+        os.chmod(handle.name, 0o644)
+    os.replace(handle.name, file_path)
+    _STAT_CACHE.pop(file_path, None)
+    return added
+
+
+def absolute_path(value: str | Path, base: Path) -> Path:
+    return Path(os.path.abspath(os.path.join(base, value)))
 
 
 def relative_posix(path: Path, base: Path) -> str:
@@ -326,16 +698,21 @@ def lint_with_builder(
         )
         return False
 
-    rc, out, err = run_cmd(cmd)
+    key = (tuple(cmd), (cached_stat(target) or target.stat()).st_mtime_ns)
+    result = _LINT_CACHE.get(key)
+    if result is None:
+        result = _LINT_CACHE[key] = run_cmd(cmd)
+    rc, raw_out, raw_err = result
     if rc == 0:
         reporter.ok(section, f"`flatpak-builder-lint {kind}` passed", str(target))
         return True
 
+    out, err = decode_output(raw_out), decode_output(raw_err)
     merged = "\n".join([out, err]).strip()
     lint_ids = extract_linter_ids(merged)
     hints: list[str] = []
-    for lint_id in lint_ids:
-        hints.extend(LINTER_HINTS.get(lint_id, []))
+    for lint_id in sorted(LINTER_HINTS.keys() & set(lint_ids)):
+        hints.extend(LINTER_HINTS[lint_id])
 
     detail = compact_output(out, err)
     if lint_ids:
@@ -346,26 +723,53 @@ def lint_with_builder(
     return False
 
 
+def iter_modules(modules: list[Any]) -> Iterator[dict[str, Any]]:
+    stack = list(reversed(modules or []))
+    while stack:
+        module = stack.pop()
+        if not isinstance(module, dict):
+            continue
+        yield module
+        nested = module.get("modules")
+        if isinstance(nested, list):
+            stack.extend(reversed(nested))
+
+
+def lint_report(kind: str, target: Path, tooling: dict[str, Any]) -> Reporter:
+    report = Reporter()
+    lint_with_builder(kind, target, tooling, report, "Linter")
+    return report
+
+
 def flatten_modules(modules: list[Any]) -> list[dict[str, Any]]:
-    flat: list[dict[str, Any]] = []
-    for module in modules or []:
-        if isinstance(module, dict):
-            flat.append(module)
-            nested = module.get("modules")
-            if isinstance(nested, list):
-                flat.extend(flatten_modules(nested))
-    return flat
+    return list(iter_modules(modules))
+
+
+@dataclass(frozen=True)
+class PreflightContext:
+    repo_root: Path
+    manifest_path: Path
+    manifest_json: dict[str, Any]
+    modules: list[dict[str, Any]]
+
+    @classmethod
+    def build(
+        cls, repo_root: Path, manifest_path: Path, manifest_json: dict[str, Any]
+    ) -> PreflightContext:
+        return cls(
+            repo_root=repo_root.resolve(),
+            manifest_path=manifest_path.resolve(),
+            manifest_json=manifest_json,
+            modules=flatten_modules(manifest_json.get("modules") or []),
+        )
 
 
 def check_manifest_location_and_naming(
-    reporter: Reporter,
-    repo_root: Path,
-    manifest_path: Path,
-    app_id: str,
-    manifest_json: dict[str, Any],
+    reporter: Reporter, ctx: PreflightContext, app_id: str
 ) -> None:
     section = "Preflight: Manifest"
-    if manifest_path.parent.resolve() != repo_root.resolve():
+    manifest_path = ctx.manifest_path
+    if manifest_path.parent != ctx.repo_root:
         reporter.error(
             section,
             "Manifest is not in repo root",
@@ -394,8 +798,8 @@ def check_manifest_location_and_naming(
     else:
         reporter.ok(section, "App-ID shape looks valid", app_id)
 
-    runtime = manifest_json.get("runtime")
-    sdk = manifest_json.get("sdk")
+    runtime = ctx.manifest_json.get("runtime")
+    sdk = ctx.manifest_json.get("sdk")
     if runtime:
         reporter.ok(section, "Runtime set", str(runtime))
     else:
@@ -406,31 +810,15 @@ def check_manifest_location_and_naming(
         reporter.warn(section, "SDK missing", "Add `sdk` to manifest root.")
 
 
-def check_permissions_and_offline_build(reporter: Reporter, manifest_json: dict[str, Any]) -> None:
+def check_permissions_and_offline_build(reporter: Reporter, ctx: PreflightContext) -> None:
     section = "Preflight: Permissions"
-    finish_args = manifest_json.get("finish-args") or []
+    finish_args = ctx.manifest_json.get("finish-args") or []
     finish_args = [str(item) for item in finish_args if isinstance(item, str)]
 
-    hard_patterns = [
-        "--socket=ssh-auth",
-        "--socket=ssh-agent",
-        "--filesystem=~/.ssh",
-        "--filesystem=home",
-        "--filesystem=~",
-        "--filesystem=/home",
-    ]
-    warn_patterns = [
-        "--filesystem=host",
-        "--device=all",
-        "--talk-name=*",
-        "--system-bus",
-        "--filesystem=xdg-run/",
-    ]
-
     for arg in finish_args:
-        if any(arg == pat or arg.startswith(pat) for pat in hard_patterns):
+        if HARD_PERMISSION_RE.match(arg):
             reporter.error(section, f"Disallowed static permission: {arg}")
-        elif any(arg == pat or arg.startswith(pat) for pat in warn_patterns):
+        elif WARN_PERMISSION_RE.match(arg):
             reporter.warn(
                 section,
                 f"Broad static permission: {arg}",
@@ -457,8 +845,8 @@ def check_permissions_and_offline_build(reporter: Reporter, manifest_json: dict[
             if isinstance(entry, str) and "--share=network" in entry:
                 network_hits.append(f"{label}: {entry}")
 
-    probe_build_args(manifest_json, "manifest")
-    for idx, module in enumerate(flatten_modules(manifest_json.get("modules") or [])):
+    probe_build_args(ctx.manifest_json, "manifest")
+    for idx, module in enumerate(ctx.modules):
         mod_name = module.get("name") or f"module[{idx}]"
         probe_build_args(module, str(mod_name))
 
@@ -485,9 +873,9 @@ def source_url_private(url_value: str) -> bool:
     return False
 
 
-def check_sources(reporter: Reporter, manifest_json: dict[str, Any]) -> None:
+def check_sources(reporter: Reporter, ctx: PreflightContext) -> None:
     section = "Preflight: Sources"
-    modules = flatten_modules(manifest_json.get("modules") or [])
+    modules = ctx.modules
     if not modules:
         reporter.warn(section, "No modules found in resolved manifest")
         return
@@ -527,10 +915,9 @@ def check_sources(reporter: Reporter, manifest_json: dict[str, Any]) -> None:
     reporter.ok(section, "Source scan complete", f"Checked {checks} source entries")
 
 
-def check_license_install_heuristic(reporter: Reporter, manifest_json: dict[str, Any]) -> None:
+def check_license_install_heuristic(reporter: Reporter, ctx: PreflightContext) -> None:
     section = "Preflight: License install"
-    modules = flatten_modules(manifest_json.get("modules") or [])
-    interesting = [m for m in modules if isinstance(m.get("buildsystem"), str)]
+    interesting = [m for m in ctx.modules if isinstance(m.get("buildsystem"), str)]
     if not interesting:
         reporter.warn(section, "No buildsystem modules found for license heuristic")
         return
@@ -564,59 +951,128 @@ def check_license_install_heuristic(reporter: Reporter, manifest_json: dict[str,
         )
 
 
-def check_repo_hygiene(reporter: Reporter, repo_root: Path) -> None:
+def check_repo_hygiene(reporter: Reporter, index: RepoIndex) -> None:
     section = "Preflight: Repo hygiene"
-    blocked = [repo_root / ".flatpak-builder", repo_root / "build", repo_root / "repo"]
-    found_blocked = [str(path) for path in blocked if path.exists()]
+    blocked = (".flatpak-builder", "build", "repo")
+    found_blocked = [str(index.root / name) for name in blocked if name in index.top_level]
     if found_blocked:
         reporter.error(section, "Build artifacts found in repo", "\n".join(found_blocked))
     else:
         reporter.ok(section, "No top-level build artifacts found")
 
-    pycache_hits = [
-        str(p) for p in repo_root.glob("**/__pycache__") if p.is_dir() and ".git" not in p.parts
-    ]
-    pyc_hits = [str(p) for p in repo_root.glob("**/*.pyc") if p.is_file() and ".git" not in p.parts]
-    flatpak_hits = [
-        str(p) for p in repo_root.glob("**/*.flatpak") if p.is_file() and ".git" not in p.parts
-    ]
-
-    if pycache_hits or pyc_hits or flatpak_hits:
-        lines = []
-        lines.extend(pycache_hits[:20])
-        lines.extend(pyc_hits[:20])
-        lines.extend(flatpak_hits[:20])
+    if index.pycache_dirs or index.pyc_files or index.flatpak_files:
+        lines: list[str] = []
+        lines.extend(index.pycache_dirs[:20])
+        lines.extend(index.pyc_files[:20])
+        lines.extend(index.flatpak_files[:20])
         reporter.warn(section, "Generated files present", "\n".join(lines))
     else:
         reporter.ok(section, "No obvious generated files detected")
 
+    if index.large_files:
+        lines = list(index.large_files[:LARGE_FILE_LIMIT])
+        if len(index.large_files) > LARGE_FILE_LIMIT:
+            lines.append("... (more not listed; scan stopped early)")
+        reporter.warn(
+            section, f"Files >= {LARGE_FILE_BYTES // (1024 * 1024)} MiB present", "\n".join(lines)
+        )
+
+
+def iter_nul_records(stream: Any, chunk_size: int = 65536) -> Iterator[bytes]:
+    pending = b""
+    while chunk := stream.read(chunk_size):
+        *records, pending = (pending + chunk).split(b"\0")
+        yield from records
+    if pending:
+        yield pending
+
 
 def check_git_clean(reporter: Reporter, repo_root: Path, workdir: Path) -> None:
     section = "Preflight: Git clean"
-    rc, out, err = run_cmd(["git", "status", "--porcelain"], cwd=repo_root)
-    if rc != 0:
-        reporter.warn(section, "`git status --porcelain` failed", err.strip() or out.strip())
-        return
-
-    rel_workdir = relative_posix(workdir, repo_root).rstrip("/") + "/"
+    cmd = ["git", "status", "--porcelain=v2", "-z", "--untracked-files=normal", "--", "."]
+    rel_workdir = relative_posix(workdir, repo_root).rstrip("/")
+    if rel_workdir not in ("", ".") and not rel_workdir.startswith("/"):
+        cmd.append(f":(exclude){rel_workdir}/")
     dirty: list[str] = []
-    for line in out.splitlines():
-        if len(line) < 4:
-            continue
-        path_part = line[3:]
-        if " -> " in path_part:
-            path_part = path_part.split(" -> ", 1)[1]
-        path_part = path_part.strip()
-        if path_part.startswith(rel_workdir):
-            continue
-        dirty.append(line)
+    proc = subprocess.Popen(
+        cmd,
+        executable=find_executable("git"),
+        cwd=str(repo_root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    records = iter_nul_records(proc.stdout)
+    for record in records:
+        line = record.decode("utf-8", errors="replace")
+        kind = line[:1]
+        if kind in ("?", "!"):
+            dirty.append(f"{kind}{kind} {line[2:]}")
+        elif kind in PORCELAIN_V2_FIELDS:
+            fields = line.split(" ", PORCELAIN_V2_FIELDS[kind])
+            if len(fields) <= PORCELAIN_V2_FIELDS[kind]:
+                continue
+            if kind == "2":
+                next(records, None)
+            dirty.append(f"{fields[1].replace('.', ' ')} {fields[-1]}")
+        if len(dirty) >= 30:
+            break
+
+    if len(dirty) >= 30:
+        proc.terminate()
+        proc.communicate()
+    else:
+        _, err = proc.communicate()
+        if proc.returncode != 0:
+            message = err.decode("utf-8", errors="replace").strip()
+            reporter.warn(section, "`git status --porcelain` failed", message)
+            return
 
     if dirty:
-        reporter.warn(section, "Working tree is not clean", "\n".join(dirty[:30]))
+        reporter.warn(section, "Working tree is not clean", "\n".join(dirty))
     else:
         reporter.ok(section, "Working tree clean (excluding tester workdir)")
 
 
+def probe_url(url_value: str, timeout: int = 12) -> int:
+    req = urlrequest.Request(
+        url_value,
+        headers={"Range": "bytes=0-0", "User-Agent": "shelldeck-flathub-tester"},
+    )
+    try:
+        with urlrequest.urlopen(req, timeout=timeout) as response:
+            return int(getattr(response, "status", 200))
+    except urlerror.HTTPError as exc:
+        return exc.code
+
+
+def read_metainfo_fields(metainfo_path: Path) -> dict[str, str]:
+    fields: dict[str, str] = {}
+    stack: list[str] = []
+    with metainfo_path.open("rb") as handle:
+        for event, elem in ET.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                stack.append(elem.tag)
+                if len(stack) == 2 and elem.tag == "developer":
+                    fields.setdefault("developer_id", elem.attrib.get("id", ""))
+                continue
+
+            text = (elem.text or "").strip()
+            if len(stack) == 2:
+                if elem.tag in ("id", "metadata_license", "project_license"):
+                    fields.setdefault(elem.tag, text)
+                elif elem.tag == "launchable" and elem.attrib.get("type") == "desktop-id":
+                    fields.setdefault("launchable", text)
+                elif elem.tag == "url" and elem.attrib.get("type") in ("homepage", "bugtracker"):
+                    fields.setdefault(f"url:{elem.attrib['type']}", text)
+                elem.clear()
+            elif len(stack) == 3 and stack[1] == "developer" and elem.tag == "name":
+                fields.setdefault("developer_name", text)
+            stack.pop()
+            if len(fields) == len(METAINFO_FIELDS):
+                break
+    return fields
+
+
 def check_metainfo(
     reporter: Reporter, metainfo_path: Path | None, app_id: str, no_net: bool
 ) -> None:
@@ -627,19 +1083,12 @@ def check_metainfo(
 
     reporter.ok(section, "Metainfo detected", str(metainfo_path))
     try:
-        tree = ET.parse(metainfo_path)
-        root = tree.getroot()
+        fields = read_metainfo_fields(metainfo_path)
     except ET.ParseError as exc:
         reporter.error(section, "Metainfo XML parse failed", str(exc))
         return
 
-    def text_of(path: str) -> str:
-        node = root.find(path)
-        if node is None or node.text is None:
-            return ""
-        return node.text.strip()
-
-    component_id = text_of("id")
+    component_id = fields.get("id", "")
     if component_id != app_id:
         reporter.error(
             section,
@@ -651,20 +1100,13 @@ def check_metainfo(
 
     required_simple = ["metadata_license", "project_license"]
     for tag in required_simple:
-        value = text_of(tag)
+        value = fields.get(tag, "")
         if value:
             reporter.ok(section, f"`<{tag}>` present", value)
         else:
             reporter.error(section, f"`<{tag}>` missing")
 
-    dev = root.find("developer")
-    dev_name = root.find("developer/name")
-    if (
-        dev is not None
-        and dev.attrib.get("id")
-        and dev_name is not None
-        and (dev_name.text or "").strip()
-    ):
+    if fields.get("developer_id") and fields.get("developer_name"):
         reporter.ok(section, "`<developer id><name>` present")
     else:
         reporter.error(
@@ -673,11 +1115,7 @@ def check_metainfo(
             'Need `<developer id="..."><name>...</name></developer>`',
         )
 
-    launchable = None
-    for node in root.findall("launchable"):
-        if node.attrib.get("type") == "desktop-id":
-            launchable = (node.text or "").strip()
-            break
+    launchable = fields.get("launchable")
     if launchable:
         reporter.ok(section, "Desktop launchable present", launchable)
     else:
@@ -687,40 +1125,62 @@ def check_metainfo(
         reporter.ok(section, "URL reachability checks skipped", "--no-net enabled")
         return
 
+    urls: list[tuple[str, str]] = []
     for url_type in ("homepage", "bugtracker"):
-        node = root.find(f"url[@type='{url_type}']")
-        if node is None or not (node.text or "").strip():
+        url_value = fields.get(f"url:{url_type}")
+        if not url_value:
             reporter.warn(section, f'`<url type="{url_type}">` missing')
             continue
-        url_value = (node.text or "").strip()
+        urls.append((url_type, url_value))
+    if not urls:
+        return
+
+    def probe(url_value: str) -> int | Exception:
         try:
-            req = urlrequest.Request(url_value, method="HEAD")
-            with urlrequest.urlopen(req, timeout=12) as response:
-                code = int(getattr(response, "status", 200))
-            if code >= 400:
-                reporter.error(
-                    section, f"{url_type} URL not reachable", f"{url_value} -> HTTP {code}"
-                )
-            else:
-                reporter.ok(section, f"{url_type} URL reachable", f"{url_value} -> HTTP {code}")
-        except Exception:
-            try:
-                with urlrequest.urlopen(url_value, timeout=12) as response:
-                    code = int(getattr(response, "status", 200))
-                if code >= 400:
-                    reporter.error(
-                        section, f"{url_type} URL not reachable", f"{url_value} -> HTTP {code}"
-                    )
-                else:
-                    reporter.ok(section, f"{url_type} URL reachable", f"{url_value} -> HTTP {code}")
-            except (urlerror.URLError, urlerror.HTTPError, TimeoutError) as exc:
-                reporter.error(section, f"{url_type} URL not reachable", f"{url_value}\n{exc}")
+            return probe_url(url_value)
+        except (ValueError, OSError, http.client.HTTPException) as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(probe, [url_value for _, url_value in urls]))
+
+    for (url_type, url_value), result in zip(urls, results, strict=True):
+        if isinstance(result, Exception):
+            reporter.error(section, f"{url_type} URL not reachable", f"{url_value}\n{result}")
+        elif result >= 400:
+            reporter.error(
+                section, f"{url_type} URL not reachable", f"{url_value} -> HTTP {result}"
+            )
+        else:
+            reporter.ok(section, f"{url_type} URL reachable", f"{url_value} -> HTTP {result}")
+
+
+def check_desktop_file(reporter: Reporter, desktop_path: Path | None) -> None:
+    section = "Preflight: Desktop file"
+    if desktop_path is None:
+        return
+    if not find_executable("desktop-file-validate"):
+        reporter.ok(
+            section,
+            "Desktop file lint skipped",
+            "`desktop-file-validate` not found (package desktop-file-utils).",
+        )
+        return
+
+    rc, out, err = run_cmd(["desktop-file-validate", str(desktop_path)])
+    detail = compact_output(decode_output(out), decode_output(err))
+    if rc != 0:
+        reporter.error(section, "`desktop-file-validate` failed", detail)
+    elif detail:
+        reporter.warn(section, "`desktop-file-validate` reported hints", detail)
+    else:
+        reporter.ok(section, "`desktop-file-validate` passed", str(desktop_path))
 
 
 def check_flathub_json(reporter: Reporter, repo_root: Path) -> None:
     section = "Preflight: flathub.json"
     path = repo_root / "flathub.json"
-    if not path.exists():
+    if cached_stat(path) is None:
         reporter.warn(
             section, "No flathub.json", "Optional; useful if only some arches are supported."
         )
@@ -760,6 +1220,12 @@ def check_flathub_json(reporter: Reporter, repo_root: Path) -> None:
 
 
 def extract_dependency_manifest_refs(manifest_path: Path, repo_root: Path) -> list[Path]:
+    mtime_ns = (cached_stat(manifest_path) or manifest_path.stat()).st_mtime_ns
+    return list(_extract_dependency_manifest_refs(manifest_path, mtime_ns))
+
+
+@lru_cache(maxsize=None)
+def _extract_dependency_manifest_refs(manifest_path: Path, mtime_ns: int) -> tuple[Path, ...]:
     refs: list[Path] = []
     suffix = manifest_path.suffix.lower()
     text = manifest_path.read_text(encoding="utf-8", errors="ignore")
@@ -771,30 +1237,23 @@ def extract_dependency_manifest_refs(manifest_path: Path, repo_root: Path) -> li
                 for item in modules:
                     if isinstance(item, str) and item.endswith((".json", ".yml", ".yaml")):
                         refs.append((manifest_path.parent / item).resolve())
-            return refs
+            return tuple(refs)
         except Exception:
             pass
 
-    for match in re.finditer(r"^\s*-\s*([\w./-]+\.(?:json|ya?ml))\s*$", text, flags=re.MULTILINE):
+    for match in YAML_REF_RE.finditer(text):
         candidate = (manifest_path.parent / match.group(1)).resolve()
-        if candidate.exists() and candidate.is_file():
+        if is_regular_file(candidate):
             refs.append(candidate)
-    unique = []
-    seen: set[Path] = set()
-    for ref in refs:
-        if ref not in seen:
-            seen.add(ref)
-            unique.append(ref)
-    return unique
+    return tuple(dict.fromkeys(refs))
 
 
-def collect_local_patch_files(
-    manifest_json: dict[str, Any], repo_root: Path
-) -> tuple[list[Path], list[str]]:
+def collect_local_patch_files(ctx: PreflightContext) -> tuple[list[Path], list[str]]:
     patches: list[Path] = []
     warnings: list[str] = []
-    modules = flatten_modules(manifest_json.get("modules") or [])
-    for module in modules:
+    seen_values: set[str] = set()
+    seen: set[Path] = set()
+    for module in ctx.modules:
         sources = module.get("sources")
         if not isinstance(sources, list):
             continue
@@ -804,79 +1263,107 @@ def collect_local_patch_files(
             if source.get("type") != "file":
                 continue
             path_value = source.get("path")
-            if not isinstance(path_value, str):
+            if not isinstance(path_value, str) or path_value in seen_values:
                 continue
-            candidate = (repo_root / path_value).resolve()
-            if not candidate.exists() or not candidate.is_file():
+            seen_values.add(path_value)
+            candidate = (ctx.repo_root / path_value).resolve()
+            if candidate in seen or not is_regular_file(candidate):
                 continue
+            seen.add(candidate)
             lower = candidate.name.lower()
             if lower.endswith((".patch", ".diff")):
                 patches.append(candidate)
             else:
                 warnings.append(f"Skipped non-patch file source: {candidate}")
-    unique = []
-    seen: set[Path] = set()
-    for item in patches:
-        if item not in seen:
-            seen.add(item)
-            unique.append(item)
-    return unique, warnings
+    return patches, warnings
 
 
-def copy_relative(src: Path, repo_root: Path, dst_root: Path) -> bool:
+def copy_relative(
+    src: Path,
+    repo_root: Path,
+    dst_root: Path,
+    created_dirs: set[Path] | None = None,
+    link: bool = False,
+) -> bool:
+    root_prefix = os.path.join(repo_root, "")
+    resolved = os.path.realpath(src)
+    if not resolved.startswith(root_prefix):
+        return False
+    dst = dst_root / resolved[len(root_prefix) :]
+    if created_dirs is None or dst.parent not in created_dirs:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if created_dirs is not None:
+            created_dirs.add(dst.parent)
+    if link:
+        try:
+            os.link(src, dst)
+            return True
+        except FileExistsError:
+            if dst.samefile(src):
+                return True
+        except OSError:
+            pass
     try:
-        rel = src.resolve().relative_to(repo_root.resolve())
-    except ValueError:
+        shutil.copy2(src, dst)
+    except (FileNotFoundError, IsADirectoryError):
         return False
-    dst = (dst_root / rel).resolve()
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
     return True
 
 
-def export_submission_bundle(
-    reporter: Reporter,
-    repo_root: Path,
-    manifest_path: Path,
-    manifest_json: dict[str, Any],
-    export_dir: Path,
-) -> None:
+def export_submission_bundle(reporter: Reporter, ctx: PreflightContext, export_dir: Path) -> None:
     section = "Submission export"
+    repo_root = ctx.repo_root
+    manifest_path = ctx.manifest_path
+    export_dir = Path(os.path.abspath(export_dir))
     if export_dir.exists():
         shutil.rmtree(export_dir)
     export_dir.mkdir(parents=True, exist_ok=True)
 
     copied: list[Path] = []
-    copy_relative(manifest_path, repo_root, export_dir)
+    copied_set: set[Path] = set()
+    created_dirs: set[Path] = set()
+
+    def copy_once(src: Path, link: bool = False) -> None:
+        if src in copied_set:
+            return
+        if copy_relative(src, repo_root, export_dir, created_dirs, link):
+            copied_set.add(src)
+            copied.append(src)
+
+    copy_relative(manifest_path, repo_root, export_dir, created_dirs)
+    copied_set.add(manifest_path)
     copied.append(manifest_path)
 
     flathub_json = repo_root / "flathub.json"
-    if flathub_json.exists():
-        if copy_relative(flathub_json, repo_root, export_dir):
-            copied.append(flathub_json)
+    if cached_stat(flathub_json) is not None:
+        copy_once(flathub_json)
 
-    visited: set[Path] = set()
-    queue: list[Path] = [manifest_path]
+    visited: set[str] = {os.fspath(manifest_path)}
+    queue: deque[Path] = deque([manifest_path])
     while queue:
-        current = queue.pop(0)
-        if current in visited:
-            continue
-        visited.add(current)
+        current = queue.popleft()
         for dep in extract_dependency_manifest_refs(current, repo_root):
-            if not dep.exists() or not dep.is_file():
+            key = os.fspath(dep)
+            if key in visited:
                 continue
-            if copy_relative(dep, repo_root, export_dir):
-                copied.append(dep)
+            visited.add(key)
+            if not is_regular_file(dep):
+                continue
+            copy_once(dep)
             queue.append(dep)
 
-    patch_files, patch_warnings = collect_local_patch_files(manifest_json, repo_root)
+    patch_files, patch_warnings = collect_local_patch_files(ctx)
     for patch in patch_files:
-        if copy_relative(patch, repo_root, export_dir):
-            copied.append(patch)
+        copy_once(patch, link=True)
     for warning in patch_warnings:
         reporter.warn(section, warning)
 
-    reporter.ok(section, "Submission files exported", f"{len(copied)} files -> {export_dir}")
+    reporter.ok(
+        section,
+        "Submission files exported",
+        f"{len(copied)} files -> {export_dir}\n"
+        "Manifests are copies; patch files are hardlinked to the working tree where possible.",
+    )
     reporter.ok(
         section,
         "Ready for flathub/flathub new-pr",
@@ -884,14 +1371,48 @@ def export_submission_bundle(
     )
 
 
+def run_checks(reporter: Reporter, checks: list[Callable[[Reporter], None]]) -> None:
+    def run(check: Callable[[Reporter], None]) -> Reporter:
+        shard = Reporter()
+        check(shard)
+        return shard
+
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        for shard in executor.map(run, checks):
+            reporter.merge(shard)
+
+
+def print_json_report(reporter: Reporter, code: int) -> int:
+    write = sys.stdout.write
+    write('{\n  "items": [')
+    for position, item in enumerate(reporter.items):
+        write(("," if position else "") + "\n    " + json_dumps(asdict(item)))
+    write(f'\n  ],\n  "counts": {json_dumps(reporter.counts)},\n  "exit_code": {code}\n}}\n')
+    return code
+
+
+def print_summary(reporter: Reporter, code: int) -> int:
+    reporter.print()
+    lines = [
+        "",
+        "Summary",
+        f"- ERROR: {reporter.counts['ERROR']}",
+        f"- WARN: {reporter.counts['WARN']}",
+        f"- OK: {reporter.counts['OK']}",
+        f"- Exit code: {code}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    return code
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Flathub submission preflight + lints")
     parser.add_argument("--manifest", help="Path to Flatpak manifest")
     parser.add_argument("--metainfo", help="Path to metainfo XML")
     parser.add_argument(
         "--workdir",
-        default=".flathub-test",
-        help="Workspace for build/repo artifacts (default: ./.flathub-test)",
+        default=DEFAULT_WORKDIR,
+        help=f"Workspace for build/repo artifacts (default: ./{DEFAULT_WORKDIR})",
     )
     parser.add_argument("--no-net", action="store_true", help="Skip URL reachability checks")
     parser.add_argument("--strict", action="store_true", help="Treat WARN as ERROR for exit code")
@@ -900,22 +1421,45 @@ def main() -> int:
         action="store_true",
         help="Run flathub-build into workdir and lint generated repo",
     )
-    parser.add_argument("--repo", help="Existing repo path to lint (default: <workdir>/repo)")
-    parser.add_argument("--export-submission", help="Export required submission files to directory")
+    parser.add_argument(
+        "--repo",
+        action="append",
+        help="Existing repo path to lint; repeat to lint several in parallel "
+        "(default: <workdir>/repo; --build writes to the first)",
+    )
+    parser.add_argument(
+        "--export-submission",
+        help="Export required submission files to directory "
+        "(skips checks and lints unless --build or --repo is also given)",
+    )
     parser.add_argument(
         "--check-clean", action="store_true", help="Check git working tree cleanliness"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-resolve the manifest instead of using <workdir>/.manifest-cache",
+    )
+    parser.add_argument(
+        "--refresh-tooling",
+        action="store_true",
+        help="Re-probe flatpak tooling instead of using the cached result",
+    )
     parser.add_argument(
         "--fix-gitignore",
         action="store_true",
         help="Append common artifact patterns to .gitignore when missing",
     )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the report as JSON (for CI) instead of text"
+    )
     args = parser.parse_args()
+    report = print_json_report if args.json else print_summary
 
-    repo_root = Path.cwd().resolve()
+    repo_root = Path(os.getcwd())
     reporter = Reporter()
 
-    tooling = detect_tooling()
+    tooling = load_tooling(args.refresh_tooling)
     section = "Tooling"
     if tooling["flatpak"]:
         reporter.ok(section, "`flatpak` found")
@@ -940,37 +1484,27 @@ def main() -> int:
             "Install org.flatpak.Builder or host `flatpak-builder-lint`.",
         )
 
-    workdir = Path(args.workdir)
-    if not workdir.is_absolute():
-        workdir = (repo_root / workdir).resolve()
+    workdir = absolute_path(args.workdir, repo_root)
     workdir.mkdir(parents=True, exist_ok=True)
 
     workdir_line = relative_posix(workdir, repo_root).rstrip("/") + "/"
     gitignore_path = repo_root / ".gitignore"
-    changed = ensure_line_in_file(gitignore_path, workdir_line)
-    if changed:
+    patterns = [workdir_line]
+    if args.fix_gitignore:
+        patterns.extend(GITIGNORE_FIX_PATTERNS)
+    added = ensure_lines_in_file(gitignore_path, patterns)
+    if workdir_line in added:
         reporter.ok("Workspace", "Added workdir to .gitignore", workdir_line)
     else:
         reporter.ok("Workspace", "Workdir already ignored", workdir_line)
 
     if args.fix_gitignore:
-        for pattern in [
-            ".flatpak-builder/",
-            "build/",
-            "repo/",
-            "__pycache__/",
-            "*.pyc",
-            "*.flatpak",
-        ]:
-            ensure_line_in_file(gitignore_path, pattern)
         reporter.ok("Workspace", "Applied --fix-gitignore patterns")
 
     manifest_path: Path | None
     if args.manifest:
-        manifest_path = Path(args.manifest)
-        if not manifest_path.is_absolute():
-            manifest_path = (repo_root / manifest_path).resolve()
-        if not manifest_path.exists():
+        manifest_path = absolute_path(args.manifest, repo_root)
+        if cached_stat(manifest_path) is None:
             reporter.error("Discovery", "Manifest path does not exist", str(manifest_path))
             manifest_path = None
     else:
@@ -981,17 +1515,13 @@ def main() -> int:
             reporter.error("Discovery", "Manifest autodetection failed", issue or "Unknown error")
 
     if not manifest_path:
-        reporter.print()
-        print("\nSummary")
-        print(f"- ERROR: {reporter.counts['ERROR']}")
-        print(f"- WARN: {reporter.counts['WARN']}")
-        print(f"- OK: {reporter.counts['OK']}")
-        return EXIT_ERRORS
+        return report(reporter, EXIT_ERRORS)
 
     app_id = ""
     manifest_json: dict[str, Any] = {}
     try:
-        manifest_json = resolve_manifest_to_json(manifest_path, tooling)
+        cache_dir = None if args.no_cache else workdir / ".manifest-cache"
+        manifest_json = resolve_manifest_cached(manifest_path, repo_root, tooling, cache_dir)
         app_id = str(manifest_json.get("app-id") or manifest_json.get("id") or "")
         if app_id:
             reporter.ok("Discovery", "Resolved app-id from manifest", app_id)
@@ -999,19 +1529,19 @@ def main() -> int:
             reporter.error("Discovery", "Resolved manifest missing app-id")
     except RuntimeError as exc:
         reporter.error("Discovery", "Unable to resolve manifest via --show-manifest", str(exc))
+    ctx = PreflightContext.build(repo_root, manifest_path, manifest_json)
 
+    index = index_repo(repo_root, workdir)
     metainfo_path: Path | None = None
     if args.metainfo:
-        metainfo_path = Path(args.metainfo)
-        if not metainfo_path.is_absolute():
-            metainfo_path = (repo_root / metainfo_path).resolve()
-        if not metainfo_path.exists():
+        metainfo_path = absolute_path(args.metainfo, repo_root)
+        if cached_stat(metainfo_path) is None:
             reporter.error("Discovery", "Metainfo path does not exist", str(metainfo_path))
             metainfo_path = None
     elif app_id:
-        metainfo_path = find_metainfo(repo_root, app_id)
+        metainfo_path = find_metainfo(index, app_id)
 
-    desktop_path, icon_path = find_desktop_and_icon(repo_root, app_id or None)
+    desktop_path, icon_path = find_desktop_and_icon(index, app_id or None)
     if desktop_path:
         reporter.ok("Discovery", "Desktop file detected", str(desktop_path))
     else:
@@ -1024,81 +1554,103 @@ def main() -> int:
     else:
         reporter.warn("Discovery", "No icon candidate detected")
 
-    if app_id:
-        check_manifest_location_and_naming(
-            reporter, repo_root, manifest_path, app_id, manifest_json
-        )
-        check_permissions_and_offline_build(reporter, manifest_json)
-        check_sources(reporter, manifest_json)
-        check_license_install_heuristic(reporter, manifest_json)
-        check_metainfo(reporter, metainfo_path, app_id, args.no_net)
-    check_flathub_json(reporter, repo_root)
-    check_repo_hygiene(reporter, repo_root)
-
-    if args.check_clean:
-        check_git_clean(reporter, repo_root, workdir)
-
-    lint_ok = True
-    lint_ok = lint_with_builder("manifest", manifest_path, tooling, reporter, "Linter") and lint_ok
-    if metainfo_path:
-        lint_ok = (
-            lint_with_builder("appstream", metainfo_path, tooling, reporter, "Linter") and lint_ok
-        )
-    else:
-        reporter.error("Linter", "Cannot run appstream lint", "Metainfo file not found.")
-        lint_ok = False
-
-    repo_to_lint = Path(args.repo).resolve() if args.repo else (workdir / "repo").resolve()
-    if args.build:
-        build_cmd = flathub_build_cmd(tooling, repo_to_lint, manifest_path)
-        if not build_cmd:
-            reporter.error(
-                "Build",
-                "flathub-build unavailable",
-                "Need org.flatpak.Builder or host flathub-build",
-            )
-        else:
-            repo_to_lint.parent.mkdir(parents=True, exist_ok=True)
-            rc, out, err = run_cmd(build_cmd, cwd=workdir)
-            if rc != 0:
-                reporter.error("Build", "flathub-build failed", compact_output(out, err))
+    lint_requested = args.build or args.repo or not args.export_submission
+    if lint_requested:
+        checks: list[Callable[[Reporter], None]] = []
+        if app_id:
+            checks += [
+                partial(check_manifest_location_and_naming, ctx=ctx, app_id=app_id),
+                partial(check_permissions_and_offline_build, ctx=ctx),
+                partial(check_sources, ctx=ctx),
+                partial(check_license_install_heuristic, ctx=ctx),
+                partial(
+                    check_metainfo, metainfo_path=metainfo_path, app_id=app_id, no_net=args.no_net
+                ),
+            ]
+        checks += [
+            partial(check_desktop_file, desktop_path=desktop_path),
+            partial(check_flathub_json, repo_root=repo_root),
+            partial(check_repo_hygiene, index=index),
+        ]
+        if args.check_clean:
+            checks.append(partial(check_git_clean, repo_root=repo_root, workdir=workdir))
+
+        lint_targets = [("manifest", manifest_path)]
+        if metainfo_path:
+            lint_targets.append(("appstream", metainfo_path))
+
+        tail = Reporter()
+        repo_paths = [absolute_path(path, repo_root) for path in args.repo or [workdir / "repo"]]
+        repo_to_lint, extra_repos = repo_paths[0], []
+        for path in dict.fromkeys(path for path in repo_paths[1:] if path != repo_to_lint):
+            if cached_stat(path) is not None:
+                extra_repos.append(path)
+            else:
+                tail.error("Linter", "Repo path for lint does not exist", str(path))
+
+        with ThreadPoolExecutor(max_workers=len(lint_targets) + len(extra_repos)) as executor:
+            lint_reports = [
+                executor.submit(lint_report, kind, target, tooling) for kind, target in lint_targets
+            ]
+            extra_reports = [
+                executor.submit(lint_report, "repo", path, tooling) for path in extra_repos
+            ]
+            run_checks(reporter, checks)
+
+            if args.build:
+                build_cmd = flathub_build_cmd(tooling, repo_to_lint, manifest_path)
+                if not build_cmd:
+                    tail.error(
+                        "Build",
+                        "flathub-build unavailable",
+                        "Need org.flatpak.Builder or host flathub-build",
+                    )
+                else:
+                    repo_to_lint.parent.mkdir(parents=True, exist_ok=True)
+                    log_path = workdir / "build.log"
+                    rc, last_lines = run_cmd_streaming(build_cmd, cwd=workdir, log_path=log_path)
+                    _STAT_CACHE.pop(repo_to_lint, None)
+                    if rc != 0:
+                        detail = "\n".join(list(last_lines)[-12:] + [f"Full log: {log_path}"])
+                        tail.error("Build", "flathub-build failed", detail)
+                    else:
+                        tail.ok("Build", "flathub-build completed", str(repo_to_lint))
+
+            if cached_stat(repo_to_lint) is not None:
+                lint_with_builder("repo", repo_to_lint, tooling, tail, "Linter")
+            elif args.repo or args.build:
+                tail.error("Linter", "Repo path for lint does not exist", str(repo_to_lint))
             else:
-                reporter.ok("Build", "flathub-build completed", str(repo_to_lint))
+                tail.warn(
+                    "Linter",
+                    "Repo lint skipped",
+                    f"No repo at {repo_to_lint}. Use --build or --repo.",
+                )
 
-    if repo_to_lint.exists():
-        lint_with_builder("repo", repo_to_lint, tooling, reporter, "Linter")
-    elif args.repo or args.build:
-        reporter.error("Linter", "Repo path for lint does not exist", str(repo_to_lint))
+            for future in lint_reports:
+                reporter.merge(future.result())
+        if not metainfo_path:
+            reporter.error("Linter", "Cannot run appstream lint", "Metainfo file not found.")
+        reporter.merge(tail)
+        for future in extra_reports:
+            reporter.merge(future.result())
     else:
-        reporter.warn(
-            "Linter", "Repo lint skipped", f"No repo at {repo_to_lint}. Use --build or --repo."
-        )
+        reporter.ok("Linter", "Checks and lints skipped", "Only --export-submission requested.")
 
     if args.export_submission:
-        export_dir = Path(args.export_submission)
-        if not export_dir.is_absolute():
-            export_dir = (repo_root / export_dir).resolve()
-        export_submission_bundle(reporter, repo_root, manifest_path, manifest_json, export_dir)
-
-    reporter.print()
-    print("\nSummary")
-    print(f"- ERROR: {reporter.counts['ERROR']}")
-    print(f"- WARN: {reporter.counts['WARN']}")
-    print(f"- OK: {reporter.counts['OK']}")
+        export_dir = absolute_path(args.export_submission, repo_root)
+        export_submission_bundle(reporter, ctx, export_dir)
 
-    tooling_errors = any(
-        item["level"] == "ERROR" and item["section"] == "Tooling" for item in reporter.items
-    )
+    tooling_errors = reporter.section_counts["Tooling"]["ERROR"] > 0
     errors = reporter.counts["ERROR"]
     warns = reporter.counts["WARN"]
     if tooling_errors:
-        print(f"- Exit code: {EXIT_TOOLING}")
-        return EXIT_TOOLING
-    if errors > 0 or (args.strict and warns > 0):
-        print(f"- Exit code: {EXIT_ERRORS}")
-        return EXIT_ERRORS
-    print(f"- Exit code: {EXIT_OK}")
-    return EXIT_OK
+        code = EXIT_TOOLING
+    elif errors > 0 or (args.strict and warns > 0):
+        code = EXIT_ERRORS
+    else:
+        code = EXIT_OK
+    return report(reporter, code)
 
 
 if __name__ == "__main__":